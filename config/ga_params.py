@@ -25,6 +25,18 @@ NUM_WORKERS = None  # None = use all available CPU cores, or specify manually (e
 
 VALIDATE_POPULATION_INTEGRITY = False  # Set to True to enable strict validation checks
 
+# ============================================================================
+# HEAVY-TAILED MUTATION RATE
+# ============================================================================
+# When enabled, each mutated individual draws its own per-gene mutation rate
+# alpha / n (n = genes per individual), with alpha in [1, n/2] drawn from a
+# power law P(alpha) ~ alpha^-beta. Most mutations then touch a few genes,
+# with occasional large jumps that help escape local optima.
+# When disabled, every gene mutates with the fixed MUTPB.
+
+HEAVY_TAILED_MUTATION = False
+MUTATION_POWER_LAW_BETA = 1.5  # Power-law exponent (> 1); smaller = heavier tail
+
 # ============================================================================
 # REPAIR HEURISTICS CONFIGURATION
 # ============================================================================
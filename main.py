@@ -40,15 +40,16 @@ def main():
         - Set USE_MULTIPROCESSING=False for debugging or single-threaded execution
     """
     pool = None
+    workers = None
 
     # Create multiprocessing pool if enabled
     if USE_MULTIPROCESSING:
         import multiprocessing
+        import os
 
-        pool = multiprocessing.Pool(processes=NUM_WORKERS)
-        console.print(
-            f"[cyan]Multiprocessing enabled: {pool._processes} workers[/cyan]"
-        )
+        workers = NUM_WORKERS or os.cpu_count() or 1
+        pool = multiprocessing.Pool(processes=workers)
+        console.print(f"[cyan]Multiprocessing enabled: {workers} workers[/cyan]")
     else:
         console.print(
             "[yellow]Running in single-threaded mode (USE_MULTIPROCESSING=False)[/yellow]"
@@ -62,6 +63,7 @@ def main():
             mutation_prob=MUTPB,
             validate=True,  # Enable input validation
             pool=pool,  # Pass pool for parallel evaluation
+            workers=workers,
         )
 
         # Print final summary with beautiful rich formatting
@@ -14,41 +14,30 @@ def no_group_overlap(sessions: List[CourseSession]) -> int:
     Returns:
         int: Total number of group-time conflicts.
     """
-    conflict_count = 0
-    group_time_map = {}  # Maps (group_id, time_quanta) to count of sessions
-
-    for session in sessions:
-        for gid in session.group_ids:
-            for q in session.session_quanta:
-                key = (gid, q)
-                if key in group_time_map:
-                    conflict_count += 1
-                else:
-                    # The 'else' block is executed when the (group_id, time_quanta) key is not already in the group_time_map.
-                    # It adds this key to the map and associates it with the session's course_id.
-                    # This helps track which group is scheduled at which time, so future overlaps can be detected.
-                    group_time_map[key] = session.course_id  #
-
-    return conflict_count
+    # Every (group, quantum) occurrence beyond the first is a conflict, i.e.
+    # sum(count - 1) over buckets == occurrences - distinct buckets. Building
+    # the key list and set in comprehensions keeps the counting out of
+    # per-item Python dict probes.
+    keys = [
+        (gid, q)
+        for session in sessions
+        for gid in session.group_ids
+        for q in session.session_quanta
+    ]
+    return len(keys) - len(set(keys))
 
 
 def no_instructor_conflict(sessions: List[CourseSession]) -> int:
     """
     Counts how many times an instructor is assigned to multiple sessions at the same time.
     """
-    conflicts = 0
-    instructor_time_map = {}
-
-    for session in sessions:
-        iid = session.instructor_id
-        for q in session.session_quanta:
-            key = (iid, q)
-            if key in instructor_time_map:
-                conflicts += 1
-            else:
-                instructor_time_map[key] = session.course_id
-
-    return conflicts
+    # Same collision count as no_group_overlap: occurrences - distinct buckets
+    keys = [
+        (session.instructor_id, q)
+        for session in sessions
+        for q in session.session_quanta
+    ]
+    return len(keys) - len(set(keys))
 
 
 def instructor_not_qualified(
@@ -130,23 +119,31 @@ def room_type_mismatch(sessions: List[CourseSession]) -> int:
         required = getattr(session, "required_room_features", "lecture")
         room_type = getattr(session.room, "room_features", "lecture")
 
-        # Normalize to lowercase strings
-        required_str = (
-            (required if isinstance(required, str) else str(required)).lower().strip()
-        )
-        room_str = (
-            (room_type if isinstance(room_type, str) else str(room_type))
-            .lower()
-            .strip()
-        )
-
-        # Check if room type matches (with flexibility)
-        if not _room_type_matches(required_str, room_str):
+        if not isinstance(required, str):
+            required = str(required)
+        if not isinstance(room_type, str):
+            room_type = str(room_type)
+
+        # Compatibility is static per (required, room_type) pair, so it is
+        # resolved once and reused across sessions, individuals and generations
+        key = (required, room_type)
+        compatible = _ROOM_TYPE_COMPATIBILITY.get(key)
+        if compatible is None:
+            compatible = _room_type_matches(
+                required.lower().strip(), room_type.lower().strip()
+            )
+            _ROOM_TYPE_COMPATIBILITY[key] = compatible
+
+        if not compatible:
             violations += 1
 
     return violations
 
 
+# (required_room_features, room_features) -> compatible, filled on first use
+_ROOM_TYPE_COMPATIBILITY: Dict[tuple, bool] = {}
+
+
 def _room_type_matches(required: str, room_type: str) -> bool:
     """
     Check if room type satisfies requirement with flexible compatibility.
@@ -291,12 +288,19 @@ def get_all_hard_constraints():
     }
 
 
+# Hard constraints whose signature is (sessions, course_map) instead of (sessions)
+COURSE_AWARE_HARD_CONSTRAINTS = frozenset(
+    {"instructor_not_qualified", "incomplete_or_extra_sessions"}
+)
+
+
 def get_enabled_hard_constraints():
     """
     Returns only the enabled hard constraints based on config.
 
     Returns:
-        Dict[str, dict]: Mapping of enabled constraint names to their config (function, weight).
+        Dict[str, dict]: Mapping of enabled constraint names to their config
+        (function, weight, needs_courses).
     """
     from config.constraints import HARD_CONSTRAINTS_CONFIG
 
@@ -308,6 +312,7 @@ def get_enabled_hard_constraints():
             enabled[name] = {
                 "function": all_constraints[name],
                 "weight": config["weight"],
+                "needs_courses": name in COURSE_AWARE_HARD_CONSTRAINTS,
             }
 
     return enabled
@@ -12,6 +12,10 @@ from collections import defaultdict
 from src.entities.decoded_session import CourseSession
 from src.encoder.quantum_time_system import QuantumTimeSystem
 from config.time_config import (
+    ISOLATED_SESSION_PENALTY,
+    OVERSIZED_BLOCK_PENALTY_PER_QUANTUM,
+    PREFERRED_BLOCK_SIZE_MAX,
+    PREFERRED_BLOCK_SIZE_MIN,
     get_midday_break_quanta,
     quantum_to_day_and_within_day,
 )
@@ -19,6 +23,31 @@ from config.time_config import (
 # Global QuantumTimeSystem instance (initialized once)
 _QTS = QuantumTimeSystem()
 
+# Lookup tables derived from _QTS once at import. Constraints run for every
+# individual in every generation, so the per-quantum day scan and the break
+# window computation are resolved up front:
+#   _DAY_AND_WITHIN[q] == quantum_to_day_and_within_day(q, _QTS)
+_DAY_AND_WITHIN = [
+    quantum_to_day_and_within_day(q, _QTS) for q in range(_QTS.total_quanta)
+]
+_BREAK_QUANTA_BY_DAY = get_midday_break_quanta(_QTS)
+
+
+def _group_day_quanta(sessions: List[CourseSession]):
+    """
+    Index sessions as group_id -> day_name -> set of within-day quanta.
+
+    Shared by group_gaps_penalty and group_midday_break_violation; each call
+    builds a fresh index, so both constraints stay pure functions of sessions.
+    """
+    group_day_quanta = defaultdict(lambda: defaultdict(set))
+    for session in sessions:
+        for group_id in session.group_ids:
+            for q in session.session_quanta:
+                day, within_day = _DAY_AND_WITHIN[q]
+                group_day_quanta[group_id][day].add(within_day)
+    return group_day_quanta
+
 
 # 1. Group Compactness: penalize gaps in daily group schedule
 def group_gaps_penalty(sessions: List[CourseSession]) -> int:
@@ -39,17 +68,10 @@ def group_gaps_penalty(sessions: List[CourseSession]) -> int:
     penalty = 0
 
     # Get midday break quanta for each day
-    break_quanta_by_day = get_midday_break_quanta(_QTS)
+    break_quanta_by_day = _BREAK_QUANTA_BY_DAY
 
-    group_day_quanta = defaultdict(
-        lambda: defaultdict(set)
-    )  # group_id -> day_name -> set of within-day quanta
-
-    for session in sessions:
-        for group_id in session.group_ids:
-            for q in session.session_quanta:
-                day, within_day = quantum_to_day_and_within_day(q, _QTS)
-                group_day_quanta[group_id][day].add(within_day)
+    # group_id -> day_name -> set of within-day quanta
+    group_day_quanta = _group_day_quanta(sessions)
 
     # Analyze gaps for each group on each day
     for days in group_day_quanta.values():
@@ -96,14 +118,14 @@ def instructor_gaps_penalty(sessions: List[CourseSession]) -> int:
     penalty = 0
 
     # Get midday break quanta for each day
-    break_quanta_by_day = get_midday_break_quanta(_QTS)
+    break_quanta_by_day = _BREAK_QUANTA_BY_DAY
 
     instructor_day_quanta = defaultdict(lambda: defaultdict(set))
 
     for session in sessions:
         iid = session.instructor_id
         for q in session.session_quanta:
-            day, within_day = quantum_to_day_and_within_day(q, _QTS)
+            day, within_day = _DAY_AND_WITHIN[q]
             instructor_day_quanta[iid][day].add(within_day)
 
     # Analyze gaps for each instructor on each day
@@ -148,15 +170,9 @@ def group_midday_break_violation(sessions: List[CourseSession]) -> int:
     """
     penalty = 0
     # Get break quanta for each day (day_name -> set of within-day quanta)
-    break_quanta_by_day = get_midday_break_quanta(_QTS)
+    break_quanta_by_day = _BREAK_QUANTA_BY_DAY
 
-    group_day_quanta = defaultdict(lambda: defaultdict(set))
-
-    for session in sessions:
-        for gid in session.group_ids:
-            for q in session.session_quanta:
-                day, within_day = quantum_to_day_and_within_day(q, _QTS)
-                group_day_quanta[gid][day].add(within_day)
+    group_day_quanta = _group_day_quanta(sessions)
 
     for days in group_day_quanta.values():
         for day_name, quanta in days.items():
@@ -200,13 +216,6 @@ def session_block_clustering_penalty(sessions: List[CourseSession]) -> int:
     Returns:
         Total penalty for non-preferred block sizes.
     """
-    from config.time_config import (
-        PREFERRED_BLOCK_SIZE_MIN,
-        PREFERRED_BLOCK_SIZE_MAX,
-        ISOLATED_SESSION_PENALTY,
-        OVERSIZED_BLOCK_PENALTY_PER_QUANTUM,
-    )
-
     penalty = 0
 
     # Group sessions by (course_id, course_type, day) to find blocks
@@ -217,7 +226,7 @@ def session_block_clustering_penalty(sessions: List[CourseSession]) -> int:
         course_key = (session.course_id, session.course_type)
 
         for q in session.session_quanta:
-            day, within_day = quantum_to_day_and_within_day(q, _QTS)
+            day, within_day = _DAY_AND_WITHIN[q]
             course_day_quanta[course_key][day].append(within_day)
 
     # Analyze block sizes for each course on each day
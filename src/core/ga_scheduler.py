@@ -5,9 +5,11 @@ Encapsulates NSGA-II genetic algorithm execution for course scheduling.
 Extracted from monolithic main.py for better testability and separation of concerns.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from deap import base, tools
+import numpy as np
+import os
 import random
 import time
 from rich.console import Console
@@ -23,15 +25,24 @@ from rich.table import Table
 from rich.live import Live
 
 from src.ga.population import generate_course_group_aware_population
+from src.ga.individual import clone_individual
 from src.ga.operators.crossover import crossover_course_group_aware
 from src.ga.operators.mutation import mutate_individual
+from src.ga.operators.repair import repair_individual
+from src.ga.rng import get_rng, seed_rng
 from src.ga.evaluator.fitness import evaluate
 from src.ga.evaluator.detailed_fitness import evaluate_detailed
+from src.decoder.individual_decoder import decode_individual
 from src.metrics.diversity import average_pairwise_diversity
 from src.core.types import SchedulingContext
 
 console = Console()
 
+# Batches this small are handled in-process even when a pool is available:
+# shipping the context to workers costs more than evaluating or generating
+# a handful of individuals locally.
+PARALLEL_MIN_BATCH = 4
+
 
 @dataclass
 class GAConfig:
@@ -77,6 +88,85 @@ class GAMetrics:
     )  # NEW: Track repairs per generation
 
 
+def _generate_population_chunk(args):
+    """Pool worker: generate n individuals from a dedicated RNG seed."""
+    n, context, seed = args
+    random.seed(seed)
+    return generate_course_group_aware_population(n, context)
+
+
+def _vary_pair(pair, mate, mutate, context, repair_settings) -> Dict[str, int]:
+    """
+    Apply crossover, mutation and the configured repairs to one offspring pair.
+
+    pair is (ind1, ind2, do_cx, mut1, mut2); a member is None when it is not
+    varied (no crossover and its mutation gate closed), and ind2 is also None
+    for the unpaired last offspring of an odd-sized population. Individuals
+    are modified in place. Returns the summed repair stats.
+    """
+    ind1, ind2, do_cx, mut1, mut2 = pair
+    repair_after_cx, repair_after_mut, max_iterations, threshold = repair_settings
+    totals: Dict[str, int] = {}
+
+    def repair(ind):
+        stats = repair_individual(ind, context, max_iterations=max_iterations)
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+
+    # Crossover
+    if do_cx:
+        mate(ind1, ind2)
+        del ind1.fitness.values
+        del ind2.fitness.values
+
+        # Apply repairs after crossover if enabled
+        if repair_after_cx:
+            repair(ind1)
+            repair(ind2)
+
+    # Mutation
+    for mutant, do_mut in ((ind1, mut1), (ind2, mut2)):
+        if do_mut:
+            mutate(mutant)
+            del mutant.fitness.values
+
+            # Apply repairs after mutation if enabled
+            if repair_after_mut:
+                # Check violation threshold if specified
+                should_repair = True
+
+                if threshold is not None and mutant.fitness.valid:
+                    should_repair = mutant.fitness.values[0] > threshold
+
+                if should_repair:
+                    repair(mutant)
+
+    return totals
+
+
+def _vary_pairs_chunk(args):
+    """Pool worker: vary a chunk of offspring pairs from a dedicated RNG seed."""
+    pairs, mate, mutate, context, repair_settings, seed = args
+    random.seed(seed)
+    seed_rng(random.getrandbits(64))
+    results = []
+    for pair in pairs:
+        stats = _vary_pair(pair, mate, mutate, context, repair_settings)
+        results.append((pair[0], pair[1], stats))
+    return results
+
+
+def _replacement_pool(population: List, offspring: List) -> List:
+    """
+    Parents plus offspring for survival selection, each object listed once.
+
+    Offspring that were not cloned are their parent's object; listing them
+    twice would let one individual fill two population slots (and memetic
+    repair edits survivors in place). Order is kept: parents first.
+    """
+    return list({id(ind): ind for ind in population + offspring}.values())
+
+
 class GAScheduler:
     """
     Manages NSGA-II genetic algorithm execution for timetabling.
@@ -104,6 +194,7 @@ class GAScheduler:
         hard_constraint_names: List[str],
         soft_constraint_names: List[str],
         pool=None,  # NEW: Optional multiprocessing Pool
+        workers: Optional[int] = None,
     ):
         """
         Initialize GA scheduler.
@@ -114,12 +205,14 @@ class GAScheduler:
             hard_constraint_names: Names of enabled hard constraints
             soft_constraint_names: Names of enabled soft constraints
             pool: Optional multiprocessing.Pool for parallel fitness evaluation
+            workers: Number of processes in pool (defaults to the CPU count)
         """
         self.config = config
         self.context = context
         self.hard_constraint_names = hard_constraint_names
         self.soft_constraint_names = soft_constraint_names
         self.pool = pool  # NEW: Store pool for parallel evaluation
+        self.workers = (workers or os.cpu_count() or 1) if pool is not None else 1
 
         self.toolbox = None
         self.population = None
@@ -128,6 +221,23 @@ class GAScheduler:
             detailed_soft={name: [] for name in soft_constraint_names},
         )
 
+        # Detailed breakdown of the last reported best individual:
+        # (individual, (hard_details, soft_details)). NSGA-II elitism usually
+        # keeps the same best object across generations, so its breakdown is
+        # reused until that individual is modified in place (memetic repair).
+        self._best_details = None
+
+        # Decoded sessions of the last individual decoded here:
+        # (individual, sessions). Shared by the detailed breakdown and the
+        # final schedule export so the best individual is decoded once.
+        self._decoded = None
+
+        # True while self.population is in the order produced by the last
+        # NSGA-II survival selection (fronts by rank, last front by crowding).
+        # Parent selection with k == pop_size would only recompute that same
+        # ordering, so it is skipped while the flag holds.
+        self._population_ranked = False
+
     def setup_toolbox(self):
         """Initialize DEAP toolbox with operators."""
         self.toolbox = base.Toolbox()
@@ -136,6 +246,9 @@ class GAScheduler:
         if self.pool is not None:
             self.toolbox.register("map", self.pool.map)
 
+        # Gene-wise clone instead of DEAP's default copy.deepcopy
+        self.toolbox.register("clone", clone_individual)
+
         # Selection operator
         self.toolbox.register("select", tools.selNSGA2)
 
@@ -183,7 +296,7 @@ class GAScheduler:
         ) as progress:
             task = progress.add_task("[cyan]Initializing Population...", total=2)
 
-            self.population = self.toolbox.population(n=self.config.pop_size)
+            self.population = self._generate_population(self.config.pop_size)
             progress.advance(task)
 
             # Validate gene alignment
@@ -193,10 +306,106 @@ class GAScheduler:
         # Evaluate initial population
         console.print("[cyan]Evaluating Initial Population...[/cyan]")
 
-        # Use toolbox.map for parallel evaluation when pool is available
-        fitness_values = list(self.toolbox.map(self.toolbox.evaluate, self.population))
+        self._evaluate_individuals(self.population)
+
+    def _generate_population(self, n: int) -> List:
+        """
+        Generate the initial population, split across the worker pool when
+        one is available.
+
+        Each worker gets one chunk and a seed drawn from the main RNG, so a
+        seeded run stays reproducible for a given worker count.
+        """
+        if self.pool is None or n <= PARALLEL_MIN_BATCH:
+            return self.toolbox.population(n=n)
+
+        workers = self.workers
+        sizes = [n // workers + (1 if i < n % workers else 0) for i in range(workers)]
+        jobs = [(size, self.context, random.randrange(2**32)) for size in sizes if size]
+
+        population = []
+        for chunk in self.pool.map(_generate_population_chunk, jobs):
+            population.extend(chunk)
+        return population
+
+    def _vary_pairs(self, offspring, jobs, repair_settings) -> List:
+        """
+        Vary the offspring pairs described by jobs; returns one
+        (child1, child2, repair_stats) per job, in job order.
+
+        Pairs are independent, so with a worker pool they are split into one
+        contiguous chunk per worker, each with a seed drawn from the main RNG
+        (seeded runs stay reproducible for a given worker count). Children
+        come back as copies and replace the originals in offspring.
+
+        A pair member whose gates are all closed is sent (and returned) as
+        None: it is not modified, and the original object must stay in
+        offspring rather than be replaced by a pickled copy of itself.
+        """
+        mate = self.toolbox.mate
+        mutate = self.toolbox.mutate
+        pairs = [
+            (
+                offspring[i] if do_cx or mut1 else None,
+                offspring[j] if j is not None and (do_cx or mut2) else None,
+                do_cx,
+                mut1,
+                mut2,
+            )
+            for i, j, do_cx, mut1, mut2 in jobs
+        ]
+
+        if self.pool is None or len(pairs) <= PARALLEL_MIN_BATCH:
+            context = self.context
+            return [
+                (
+                    pair[0],
+                    pair[1],
+                    _vary_pair(pair, mate, mutate, context, repair_settings),
+                )
+                for pair in pairs
+            ]
+
+        workers = self.workers
+        bounds = [len(pairs) * w // workers for w in range(workers + 1)]
+        chunks = [
+            (
+                pairs[lo:hi],
+                mate,
+                mutate,
+                self.context,
+                repair_settings,
+                random.randrange(2**32),
+            )
+            for lo, hi in zip(bounds, bounds[1:])
+            if hi > lo
+        ]
+
+        results = []
+        for chunk in self.pool.map(_vary_pairs_chunk, chunks):
+            results.extend(chunk)
+        return results
+
+    def _evaluate_individuals(self, individuals):
+        """
+        Evaluate individuals and assign their fitness values.
+
+        Uses the worker pool when one is available and the batch is large
+        enough to be worth dispatching; work is split into ~4 chunks per
+        worker so each worker receives the evaluate partial only a few times.
+        """
+        if not individuals:
+            return
+
+        if self.pool is not None and len(individuals) > PARALLEL_MIN_BATCH:
+            chunksize = max(1, len(individuals) // (4 * self.workers))
+            fitness_values = self.pool.map(
+                self.toolbox.evaluate, individuals, chunksize=chunksize
+            )
+        else:
+            fitness_values = map(self.toolbox.evaluate, individuals)
 
-        for ind, fit in zip(self.population, fitness_values):
+        for ind, fit in zip(individuals, fitness_values):
             ind.fitness.values = fit
 
     def evolve(self):
@@ -286,92 +495,81 @@ class GAScheduler:
             "total_fixes": 0,
         }
 
-        # Selection
-        offspring = self.toolbox.select(self.population, len(self.population))
-        offspring = list(map(self.toolbox.clone, offspring))
-
-        # Crossover
-        for i in range(1, len(offspring), 2):
-            if random.random() < self.config.crossover_prob:
-                self.toolbox.mate(offspring[i - 1], offspring[i])
-                del offspring[i - 1].fitness.values
-                del offspring[i].fitness.values
-
-                # Apply repairs after crossover if enabled
-                if repair_config.get("enabled", False) and repair_config.get(
-                    "apply_after_crossover", False
-                ):
-                    from src.ga.operators.repair import repair_individual
-
-                    stats1 = repair_individual(
-                        offspring[i - 1],
-                        self.context,
-                        max_iterations=repair_config.get("max_iterations", 3),
-                    )
-                    stats2 = repair_individual(
-                        offspring[i],
-                        self.context,
-                        max_iterations=repair_config.get("max_iterations", 3),
-                    )
+        # Selection (reuses the survival ordering from the previous generation)
+        if self._population_ranked:
+            offspring = self.population
+        else:
+            offspring = self.toolbox.select(self.population, len(self.population))
+
+        # Reseed the shared generator from the main RNG once per generation
+        # so seeded runs stay reproducible, then draw this generation's
+        # crossover/mutation gates from it in one batch
+        seed_rng(random.getrandbits(64))
+        rng = get_rng()
+        cx_gates = rng.random(len(offspring) // 2) < self.config.crossover_prob
+        mut_gates = rng.random(len(offspring)) < self.config.mutation_prob
+
+        # Copy-on-write: clone only offspring that crossover or mutation will
+        # modify in place. The rest would be identical copies of their parent
+        # (same genes, still-valid fitness), so they are carried by reference.
+        modified = mut_gates.copy()
+        modified[: 2 * len(cx_gates)] |= np.repeat(cx_gates, 2)
+        offspring = [
+            self.toolbox.clone(ind) if will_change else ind
+            for ind, will_change in zip(offspring, modified)
+        ]
 
-                    # Aggregate all repair stats
-                    for key in generation_repair_stats.keys():
-                        if key in stats1 and key in stats2:
-                            generation_repair_stats[key] += stats1[key] + stats2[key]
-
-        # Mutation
-        for mutant in offspring:
-            if random.random() < self.config.mutation_prob:
-                self.toolbox.mutate(mutant)
-                del mutant.fitness.values
-
-                # Apply repairs after mutation if enabled
-                if repair_config.get("enabled", False) and repair_config.get(
-                    "apply_after_mutation", False
-                ):
-                    from src.ga.operators.repair import repair_individual
-
-                    # Check violation threshold if specified
-                    threshold = repair_config.get("violation_threshold")
-                    should_repair = True
-
-                    if threshold is not None and mutant.fitness.valid:
-                        should_repair = mutant.fitness.values[0] > threshold
-
-                    if should_repair:
-                        stats = repair_individual(
-                            mutant,
-                            self.context,
-                            max_iterations=repair_config.get("max_iterations", 3),
-                        )
-
-                        # Aggregate all repair stats
-                        for key in generation_repair_stats.keys():
-                            if key in stats:
-                                generation_repair_stats[key] += stats[key]
+        # Loop-invariant settings, resolved once per generation
+        repair_enabled = repair_config.get("enabled", False)
+        repair_settings = (
+            repair_enabled and repair_config.get("apply_after_crossover", False),
+            repair_enabled and repair_config.get("apply_after_mutation", False),
+            repair_config.get("max_iterations", 3),
+            repair_config.get("violation_threshold"),
+        )
+
+        # Crossover and mutation (with their repairs) per offspring pair; only
+        # pairs with at least one gate open are varied
+        jobs = []
+        n = len(offspring)
+        for i in range(0, n, 2):
+            j = i + 1 if i + 1 < n else None
+            do_cx = j is not None and bool(cx_gates[i // 2])
+            mut1 = bool(mut_gates[i])
+            mut2 = j is not None and bool(mut_gates[j])
+            if do_cx or mut1 or mut2:
+                jobs.append((i, j, do_cx, mut1, mut2))
+
+        for (i, j, *_), (child1, child2, stats) in zip(
+            jobs, self._vary_pairs(offspring, jobs, repair_settings)
+        ):
+            # Only varied members come back; untouched ones stay as they are
+            if child1 is not None:
+                offspring[i] = child1
+            if child2 is not None:
+                offspring[j] = child2
+
+            # Aggregate all repair stats
+            for key in generation_repair_stats.keys():
+                if key in stats:
+                    generation_repair_stats[key] += stats[key]
 
         # Evaluate invalid individuals
         invalid = [ind for ind in offspring if not ind.fitness.valid]
-        if invalid:
-            # Use toolbox.map for parallel evaluation when pool is available
-            fitness_values = list(self.toolbox.map(self.toolbox.evaluate, invalid))
-            for ind, fit in zip(invalid, fitness_values):
-                ind.fitness.values = fit
+        self._evaluate_individuals(invalid)
 
         # Replacement: combine parents and offspring, select next generation
-        combined = self.population + offspring
+        combined = _replacement_pool(self.population, offspring)
         self.population[:] = self.toolbox.select(combined, len(self.population))
+        self._population_ranked = True
 
         # Memetic mode: Apply intensive local search to elite individuals
-        if repair_config.get("enabled", False) and repair_config.get(
-            "memetic_mode", False
-        ):
-            from src.ga.operators.repair import repair_individual
-
+        if repair_enabled and repair_config.get("memetic_mode", False):
             elite_percentage = repair_config.get("elite_percentage", 0.2)
             elite_count = max(1, int(elite_percentage * len(self.population)))
             elite_individuals = tools.selBest(self.population, elite_count)
 
+            repaired_elites = []
             for individual in elite_individuals:
                 stats = repair_individual(
                     individual,
@@ -379,21 +577,25 @@ class GAScheduler:
                     max_iterations=repair_config.get("memetic_iterations", 5),
                 )
 
-                # Invalidate fitness after repair
-                del individual.fitness.values
-
                 # Aggregate all memetic stats
                 for key in generation_repair_stats.keys():
                     if key in stats:
                         generation_repair_stats[key] += stats[key]
 
-            # Re-evaluate elite after memetic repair
-            # Use toolbox.map for parallel evaluation when pool is available
-            fitness_values = list(
-                self.toolbox.map(self.toolbox.evaluate, elite_individuals)
-            )
-            for ind, fit in zip(elite_individuals, fitness_values):
-                ind.fitness.values = fit
+                # Repair heuristics only touch genes when they count a fix, so an
+                # elite with zero fixes is unchanged and keeps its known fitness.
+                if stats["total_fixes"] == 0:
+                    continue
+
+                # Invalidate fitness (and cached breakdown/decode) after repair
+                del individual.fitness.values
+                self._best_details = None
+                self._decoded = None
+                self._population_ranked = False
+                repaired_elites.append(individual)
+
+            # Re-evaluate only the elites that memetic repair actually changed
+            self._evaluate_individuals(repaired_elites)
 
         # Store generation repair stats
         self.metrics.repair_stats.append(generation_repair_stats)
@@ -403,24 +605,16 @@ class GAScheduler:
 
     def _track_metrics(self, gen: int):
         """Record metrics for current generation."""
-        # Basic metrics
-        self.metrics.hard_violations.append(
-            min(ind.fitness.values[0] for ind in self.population)
-        )
-        self.metrics.soft_penalties.append(
-            min(ind.fitness.values[1] for ind in self.population)
-        )
+        # Basic metrics: one (pop_size, 2) array, reduced per objective
+        fitness_values = np.array([ind.fitness.values for ind in self.population])
+        min_hard, min_soft = fitness_values.min(axis=0)
+        self.metrics.hard_violations.append(float(min_hard))
+        self.metrics.soft_penalties.append(float(min_soft))
         self.metrics.diversity.append(average_pairwise_diversity(self.population))
 
         # Detailed constraint breakdown
         best = tools.selBest(self.population, 1)[0]
-        hard_details, soft_details = evaluate_detailed(
-            best,
-            self.context.courses,
-            self.context.instructors,
-            self.context.groups,
-            self.context.rooms,
-        )
+        hard_details, soft_details = self._get_detailed_breakdown(best)
 
         for name in self.hard_constraint_names:
             self.metrics.detailed_hard[name].append(hard_details[name])
@@ -432,6 +626,45 @@ class GAScheduler:
         if gen % 10 == 0 or gen == self.config.generations - 1:
             self._log_generation_details(gen, best, hard_details, soft_details)
 
+    def _get_detailed_breakdown(self, individual) -> Tuple[Dict, Dict]:
+        """
+        Return per-constraint penalties for an individual, reusing the cached
+        breakdown when the same (unmodified) individual is still the best.
+        """
+        cached = self._best_details
+        if cached is not None and cached[0] is individual:
+            return cached[1]
+
+        details = evaluate_detailed(
+            individual,
+            self.context.courses,
+            self.context.instructors,
+            self.context.groups,
+            self.context.rooms,
+            sessions=self.decode_solution(individual),
+        )
+        self._best_details = (individual, details)
+        return details
+
+    def decode_solution(self, individual):
+        """
+        Decode an individual into CourseSession objects, reusing the cached
+        decode when it is the same (unmodified) individual as last time.
+        """
+        cached = self._decoded
+        if cached is not None and cached[0] is individual:
+            return cached[1]
+
+        sessions = decode_individual(
+            individual,
+            self.context.courses,
+            self.context.instructors,
+            self.context.groups,
+            self.context.rooms,
+        )
+        self._decoded = (individual, sessions)
+        return sessions
+
     def _log_generation_details(
         self, gen: int, best, hard_details: Dict, soft_details: Dict
     ):
@@ -527,17 +760,11 @@ class GAScheduler:
         if not self.population:
             return
 
-        reference = [
-            (gene.course_id, gene.course_type, tuple(sorted(gene.group_ids)))
-            for gene in self.population[0]
-        ]
+        reference = [gene.identity_key for gene in self.population[0]]
         reference_set = set(reference)
 
         for idx, individual in enumerate(self.population[1:], start=1):
-            current = [
-                (gene.course_id, gene.course_type, tuple(sorted(gene.group_ids)))
-                for gene in individual
-            ]
+            current = [gene.identity_key for gene in individual]
             current_set = set(current)
 
             if current_set != reference_set:
@@ -4,8 +4,9 @@ Core Type Definitions
 This module contains type-safe data structures used throughout the system.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterable, List, Tuple
 
 from src.entities.course import Course
 from src.entities.group import Group
@@ -13,6 +14,19 @@ from src.entities.instructor import Instructor
 from src.entities.room import Room
 
 
+def quanta_mask(quanta: Iterable[int]) -> int:
+    """
+    Int bitmask with bit q set for each quantum q in quanta.
+
+    A set of quanta is covered by an availability mask when
+    avail & need == need, which replaces a per-quantum membership scan.
+    """
+    mask = 0
+    for q in quanta:
+        mask |= 1 << q
+    return mask
+
+
 @dataclass
 class SchedulingContext:
     """
@@ -28,6 +42,13 @@ class SchedulingContext:
         instructors: Dictionary mapping instructor IDs to Instructor objects
         rooms: Dictionary mapping room IDs to Room objects
         available_quanta: List of available time quantum indices
+        suitable_rooms_cache: Memo of find_suitable_rooms_for_course results per
+            (course_id, group_id); filled lazily, entities are fixed per run
+        rooms_for_course: Memo of the rooms meeting each course's requirements,
+            per (course_code, course_type); filled lazily by repair
+        ranked_rooms_for_course: Memo of all rooms ordered exact match,
+            flexible match, rest, per (course_code, course_type); filled
+            lazily by repair
     """
 
     courses: Dict[tuple, Course]  # Keys are (course_code, course_type) tuples
@@ -35,6 +56,128 @@ class SchedulingContext:
     instructors: Dict[str, Instructor]
     rooms: Dict[str, Room]
     available_quanta: List[int]
+    suitable_rooms_cache: Dict[Tuple[str, str], List[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    rooms_for_course: Dict[tuple, List[Room]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    ranked_rooms_for_course: Dict[tuple, List[Room]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _slot_starts: Dict[int, List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @cached_property
+    def available_quanta_list(self) -> List[int]:
+        """
+        available_quanta as a list, built once on first use.
+
+        Operators that index or sample operating quanta (e.g. mutation) share
+        this list instead of materializing list(available_quanta) per gene.
+        Treat it as read-only; available_quanta must not change after the
+        context is built.
+        """
+        return list(self.available_quanta)
+
+    @cached_property
+    def available_quanta_sorted(self) -> Tuple[int, ...]:
+        """available_quanta in ascending order, built once on first use."""
+        return tuple(sorted(self.available_quanta))
+
+    @cached_property
+    def available_quanta_mask(self) -> int:
+        """Bitmask of available_quanta (see quanta_mask), built once on first use."""
+        return quanta_mask(self.available_quanta)
+
+    @cached_property
+    def available_quanta_set(self) -> frozenset:
+        """
+        available_quanta as a frozenset, built once on first use, for
+        "is this an operating quantum" tests (available_quanta is a list).
+        """
+        return frozenset(self.available_quanta)
+
+    def slot_starts(self, duration: int) -> List[int]:
+        """
+        Start quanta of every run of `duration` consecutive operating quanta,
+        in available_quanta order. Memoized per duration.
+
+        Slot scanners iterate these instead of every operating quantum, so the
+        "whole slot within operating hours" check is done once per run.
+        Treat the returned list as read-only.
+        """
+        starts = self._slot_starts.get(duration)
+        if starts is None:
+            operating = self.available_quanta_set
+            starts = [
+                start
+                for start in self.available_quanta
+                if all(q in operating for q in range(start, start + duration))
+            ]
+            self._slot_starts[duration] = starts
+        return starts
+
+    @cached_property
+    def room_ids(self) -> List[str]:
+        """
+        IDs of all rooms (rooms order), built once on first use.
+
+        Shared fallback candidate list for room sampling; treat it as
+        read-only.
+        """
+        return list(self.rooms)
+
+    @cached_property
+    def instructor_availability_masks(self) -> Dict[str, int]:
+        """
+        instructor_id -> int bitmask with bit q set when the instructor's
+        available_quanta contains quantum q. Built once on first use.
+
+        Lets slot scanners test a whole run of consecutive quanta at once:
+        (mask >> start) & run == run, with run = (1 << duration) - 1.
+        """
+        return {
+            inst_id: quanta_mask(inst.available_quanta)
+            for inst_id, inst in self.instructors.items()
+        }
+
+    @cached_property
+    def room_availability_masks(self) -> Dict[str, int]:
+        """
+        room_id -> bitmask of the room's available_quanta (see
+        instructor_availability_masks). Built once on first use.
+        """
+        return {
+            room_id: quanta_mask(room.available_quanta)
+            for room_id, room in self.rooms.items()
+        }
+
+    @cached_property
+    def group_availability_masks(self) -> Dict[str, int]:
+        """
+        group_id -> bitmask of the group's available_quanta (see
+        instructor_availability_masks). Built once on first use.
+        """
+        return {
+            group_id: quanta_mask(group.available_quanta)
+            for group_id, group in self.groups.items()
+        }
+
+    @cached_property
+    def qualified_instructors_by_course(self) -> Dict[tuple, List[str]]:
+        """
+        (course_code, course_type) -> IDs of instructors qualified to teach it,
+        in instructors order. Built once on first use (inverse of each
+        instructor's qualified_courses); courses nobody teaches are absent.
+        Treat the lists as read-only.
+        """
+        index: Dict[tuple, List[str]] = {}
+        for inst_id, inst in self.instructors.items():
+            for course_key in dict.fromkeys(inst.qualified_courses):
+                index.setdefault(course_key, []).append(inst_id)
+        return index
 
     def validate(self) -> List[str]:
         """
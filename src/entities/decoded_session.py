@@ -1,11 +1,11 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 from src.entities.instructor import Instructor
 from src.entities.group import Group
 from src.entities.room import Room
 
 
-@dataclass
+@dataclass(slots=True)
 class CourseSession:
     """
     Represents a fully decoded session of a course within the university timetabling system.
@@ -17,9 +17,9 @@ class CourseSession:
     Attributes:
         course_id (str): Unique identifier for the course.
         instructor_id (str): ID of the instructor assigned to this session.
-        group_ids (List[str]): List of group IDs attending this session.
+        group_ids (Tuple[str, ...]): IDs of the groups attending this session.
         room_id (str): ID of the room assigned to this session.
-        session_quanta (List[int]): List of time quanta (e.g., 15-min blocks) during which the session is scheduled.
+        session_quanta (Tuple[int, ...]): Time quanta (e.g., 15-min blocks) during which the session is scheduled.
         required_room_features (str): Room feature type required (e.g., "lab", "lecture").
         course_type (str): Type of course - 'theory' or 'practical'.
         instructor (Instructor, optional): Reference to the assigned Instructor object.
@@ -29,9 +29,9 @@ class CourseSession:
 
     course_id: str
     instructor_id: str
-    group_ids: List[str]
+    group_ids: Tuple[str, ...]
     room_id: str
-    session_quanta: List[int]
+    session_quanta: Tuple[int, ...]
     required_room_features: str
     course_type: str = "theory"
     instructor: Instructor = None
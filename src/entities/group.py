@@ -3,7 +3,7 @@ Group entity model for the timetabling system.
 Represents a student group with enrollment information.
 """
 
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -18,6 +18,10 @@ class Group:
         student_count: Number of students in the group
         enrolled_courses: List of course IDs the group is enrolled in
         available_quanta: Set of available quantum time slots
+        parent_id: Parent group ID if this is a subgroup (set by
+            analyze_group_hierarchy, None otherwise)
+        subgroup_ids: Subgroup IDs if this is a parent (set by
+            analyze_group_hierarchy, empty otherwise)
     """
 
     group_id: str
@@ -25,6 +29,8 @@ class Group:
     student_count: int
     enrolled_courses: List[str]
     available_quanta: Set[int]
+    parent_id: Optional[str] = None
+    subgroup_ids: Tuple[str, ...] = ()
 
     def __post_init__(self):
         """Validate group data after initialization."""
@@ -6,6 +6,16 @@ Represents a room with its capacity, type, and availability.
 from typing import List, Set, Dict, Optional
 from dataclasses import dataclass
 
+# Room types accepted in place of a required type (besides an exact match).
+# Built once at import instead of on every is_suitable_for_course_type call.
+ROOM_TYPE_FLEXIBILITY: Dict[str, frozenset] = {
+    "lecture": frozenset({"auditorium", "seminar"}),
+    "seminar": frozenset({"lecture"}),
+    "lab": frozenset({"computer_lab", "science_lab"}),
+    "computer_lab": frozenset({"lab"}),
+    "science_lab": frozenset({"lab"}),
+}
+
 
 @dataclass
 class Room:
@@ -42,13 +52,6 @@ class Room:
         if self.room_features == required_room_features:
             return True
         # Allow flexibility for certain room types
-        flexibility_map = {
-            "lecture": ["auditorium", "seminar"],
-            "seminar": ["lecture"],
-            "lab": ["computer_lab", "science_lab"],
-            "computer_lab": ["lab"],
-            "science_lab": ["lab"],
-        }
-        if required_room_features in flexibility_map:
-            return self.room_features in flexibility_map[required_room_features]
-        return False
+        return self.room_features in ROOM_TYPE_FLEXIBILITY.get(
+            required_room_features, ()
+        )
@@ -45,20 +45,14 @@ def generate_course_group_pairs(
         set()
     )  # Track (course_code, parent_prefix) to avoid duplicates
 
-    # Group all subgroups by their parent prefix (e.g., BAE2A, BAE2B -> BAE2)
-    # This allows us to find siblings that should attend theory together
-    from collections import defaultdict
-
-    parent_to_subgroups = defaultdict(list)
+    # Subgroups grouped by their parent prefix (e.g., BAE2A, BAE2B -> BAE2),
+    # precomputed by analyze_group_hierarchy(). This lets us find siblings
+    # that should attend theory together.
+    parent_to_subgroups = hierarchy["sibling_map"]
 
-    for group_id in groups.keys():
-        # Check if this is a subgroup (ends with letter)
-        if len(group_id) > 1 and group_id[-1].isalpha():
-            parent_prefix = group_id[:-1]
-            parent_to_subgroups[parent_prefix].append(group_id)
-        else:
-            # Standalone group (no siblings)
-            parent_to_subgroups[group_id] = [group_id]
+    # (course_code, parent_prefix) enrollments with no matching course,
+    # reported once after the loop instead of printing per miss
+    missing = []
 
     # Process each group of siblings
     for parent_prefix, sibling_ids in parent_to_subgroups.items():
@@ -78,9 +72,7 @@ def generate_course_group_pairs(
                 matching_courses.append((practical_key, courses[practical_key]))
 
             if not matching_courses:
-                print(
-                    f"[!] Warning: Course {course_code} not found for group {parent_prefix}"
-                )
+                missing.append((course_code, parent_prefix))
                 continue
 
             # Process theory and practical courses separately
@@ -101,6 +93,12 @@ def generate_course_group_pairs(
                             (course_key, [sibling_id], "practical", practical_quanta)
                         )
 
+    if missing:
+        print(
+            f"[!] Warning: {len(missing)} enrolled course(s) not found; "
+            f"first 5 (course, group): {missing[:5]}"
+        )
+
     return pairs
 
 
@@ -0,0 +1,24 @@
+"""
+Fitness evaluation package.
+
+Exposes:
+    - evaluate: (hard_penalty, soft_penalty) for an individual
+    - evaluate_detailed: per-constraint penalty breakdown for an individual
+    - refresh_constraint_tables: rebuild enabled-constraint tables after a config change
+    - get_constraint_tables: the enabled-constraint tables used by evaluate
+"""
+
+from src.ga.evaluator.fitness import (
+    evaluate,
+    get_constraint_tables,
+    refresh_constraint_tables,
+)
+from src.ga.evaluator.detailed_fitness import evaluate_detailed, evaluate_from_detailed
+
+__all__ = [
+    "evaluate",
+    "evaluate_detailed",
+    "evaluate_from_detailed",
+    "refresh_constraint_tables",
+    "get_constraint_tables",
+]
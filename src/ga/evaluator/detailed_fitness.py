@@ -1,14 +1,14 @@
 from typing import List, Dict, Tuple
 from src.decoder.individual_decoder import decode_individual
 from src.ga.sessiongene import SessionGene
+from src.entities.decoded_session import CourseSession
 from src.entities.course import Course
 from src.entities.instructor import Instructor
 from src.entities.group import Group
 from src.entities.room import Room
 
-# Constraint Registries
-from src.constraints.hard import get_enabled_hard_constraints
-from src.constraints.soft import get_enabled_soft_constraints
+# Enabled-constraint tables (shared with evaluate)
+from src.ga.evaluator.fitness import get_constraint_tables
 
 
 def evaluate_detailed(
@@ -17,10 +17,14 @@ def evaluate_detailed(
     instructors: Dict[str, Instructor],
     groups: Dict[str, Group],
     rooms: Dict[str, Room] = None,
+    sessions: List[CourseSession] = None,
 ) -> Tuple[Dict[str, int], Dict[str, int]]:
     """
     Evaluates a timetable individual with detailed constraint breakdown.
 
+    If the caller already decoded the individual, pass the result as
+    ``sessions`` to skip decoding it again.
+
     Returns:
         Tuple[Dict[str, int], Dict[str, int]]: (hard_constraint_details, soft_constraint_details)
     """
@@ -28,36 +32,24 @@ def evaluate_detailed(
     if rooms is None:
         rooms = {}
 
-    sessions = decode_individual(individual, courses, instructors, groups, rooms)
+    if sessions is None:
+        sessions = decode_individual(individual, courses, instructors, groups, rooms)
+
+    hard_table, soft_table = get_constraint_tables()
 
     # Hard constraint penalties (individual breakdown using registry)
     hard_details = {}
-    enabled_hard_constraints = get_enabled_hard_constraints()
-
-    for constraint_name, constraint_info in enabled_hard_constraints.items():
-        constraint_func = constraint_info["function"]
-        weight = constraint_info["weight"]
-
-        # Some hard constraints need courses parameter
-        if constraint_name in [
-            "instructor_not_qualified",
-            "incomplete_or_extra_sessions",
-        ]:
+    for constraint_name, constraint_func, weight, needs_courses in hard_table:
+        if needs_courses:
             penalty = constraint_func(sessions, courses)
         else:
             penalty = constraint_func(sessions)
-
         hard_details[constraint_name] = weight * penalty
 
     # Soft constraint penalties (individual breakdown using registry)
     soft_details = {}
-    enabled_soft_constraints = get_enabled_soft_constraints()
-
-    for constraint_name, constraint_info in enabled_soft_constraints.items():
-        constraint_func = constraint_info["function"]
-        weight = constraint_info["weight"]
-        penalty = constraint_func(sessions)
-        soft_details[constraint_name] = weight * penalty
+    for constraint_name, constraint_func, weight, _ in soft_table:
+        soft_details[constraint_name] = weight * constraint_func(sessions)
 
     return hard_details, soft_details
 
@@ -10,6 +10,44 @@ from src.entities.room import Room
 from src.constraints.hard import get_enabled_hard_constraints
 from src.constraints.soft import get_enabled_soft_constraints
 
+# Enabled constraints resolved once from config as
+# (name, function, weight, needs_courses) rows, so evaluation does not
+# rebuild the registries for every individual.
+_HARD_TABLE = []
+_SOFT_TABLE = []
+
+
+def refresh_constraint_tables():
+    """
+    Rebuild the enabled-constraint tables from config.constraints.
+
+    Called at import; call again after changing the constraint config at runtime.
+    Tables are updated in place, so lists returned by get_constraint_tables()
+    see the change.
+    """
+    _HARD_TABLE[:] = [
+        (name, info["function"], info["weight"], info["needs_courses"])
+        for name, info in get_enabled_hard_constraints().items()
+    ]
+    _SOFT_TABLE[:] = [
+        (name, info["function"], info["weight"], False)
+        for name, info in get_enabled_soft_constraints().items()
+    ]
+
+
+def get_constraint_tables() -> Tuple[List[Tuple], List[Tuple]]:
+    """
+    Get the enabled-constraint tables used by evaluate.
+
+    Returns:
+        Tuple[List[Tuple], List[Tuple]]: (hard_table, soft_table), each a list
+        of (name, function, weight, needs_courses) rows
+    """
+    return _HARD_TABLE, _SOFT_TABLE
+
+
+refresh_constraint_tables()
+
 
 def evaluate(
     individual: List[SessionGene],
@@ -36,30 +74,15 @@ def evaluate(
 
     # Hard constraint penalty (using registry)
     hard_penalty = 0
-    enabled_hard_constraints = get_enabled_hard_constraints()
-
-    for constraint_name, constraint_info in enabled_hard_constraints.items():
-        constraint_func = constraint_info["function"]
-        weight = constraint_info["weight"]
-
-        # Some hard constraints need courses parameter
-        if constraint_name in [
-            "instructor_not_qualified",
-            "incomplete_or_extra_sessions",
-        ]:
-            penalty = constraint_func(sessions, courses)
+    for _, constraint_func, weight, needs_courses in _HARD_TABLE:
+        if needs_courses:
+            hard_penalty += weight * constraint_func(sessions, courses)
         else:
-            penalty = constraint_func(sessions)
-
-        hard_penalty += weight * penalty
+            hard_penalty += weight * constraint_func(sessions)
 
     # Soft constraint penalty (using registry)
     soft_penalty = 0
-    enabled_soft_constraints = get_enabled_soft_constraints()
-
-    for constraint_name, constraint_info in enabled_soft_constraints.items():
-        constraint_func = constraint_info["function"]
-        weight = constraint_info["weight"]
+    for _, constraint_func, weight, _ in _SOFT_TABLE:
         soft_penalty += weight * constraint_func(sessions)
 
     return (hard_penalty, soft_penalty)
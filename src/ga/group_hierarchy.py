@@ -6,7 +6,7 @@ Identifies parent groups and their subgroups to enable proper scheduling:
 - Practical sessions for subgroups separately
 """
 
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 from src.entities.group import Group
 
 
@@ -18,6 +18,10 @@ def analyze_group_hierarchy(groups: Dict[str, Group]) -> Dict:
     - Having a parent group ID as prefix (e.g., BAE2A has parent BAE2)
     - Parent group must exist in groups dict
 
+    Each Group is also annotated in place with its parent_id and
+    subgroup_ids, so callers holding a Group can read its position in the
+    hierarchy directly instead of querying the returned dict.
+
     Args:
         groups: Dictionary of group_id -> Group objects
 
@@ -26,53 +30,86 @@ def analyze_group_hierarchy(groups: Dict[str, Group]) -> Dict:
         - "parents": List of parent group IDs
         - "subgroups": Dict mapping parent_id -> [subgroup_ids]
         - "parent_map": Dict mapping subgroup_id -> parent_id
+        - "ancestors": Dict mapping subgroup_id -> tuple of all ancestors,
+          nearest first (e.g., BAE2AB -> ("BAE2A", "BAE2"))
+        - "descendants": Dict mapping parent_id -> tuple of all transitive
+          subgroups
         - "standalone": List of groups with no subgroups
+        - "sibling_map": Dict mapping sibling prefix -> [group_ids] sharing it
+          (e.g., BAE2A, BAE2B -> "BAE2"); groups without a letter suffix map
+          to themselves. Used by generate_course_group_pairs() to schedule
+          theory sessions for siblings together.
 
     Example:
         {
             "parents": ["BAE2", "BAE4"],
             "subgroups": {"BAE2": ["BAE2A", "BAE2B"], "BAE4": ["BAE4A", "BAE4B"]},
             "parent_map": {"BAE2A": "BAE2", "BAE2B": "BAE2", "BAE4A": "BAE4", "BAE4B": "BAE4"},
-            "standalone": ["BAE8"]  # Groups with no subgroups
+            "ancestors": {"BAE2A": ("BAE2",), "BAE2B": ("BAE2",), ...},
+            "descendants": {"BAE2": ("BAE2A", "BAE2B"), "BAE4": ("BAE4A", "BAE4B")},
+            "standalone": ["BAE8"],  # Groups with no subgroups
+            "sibling_map": {"BAE2": ["BAE2A", "BAE2B"], "BAE8": ["BAE8"], ...}
         }
     """
-    parents = set()
     subgroups_dict = {}  # parent_id -> [subgroup_ids]
     parent_map = {}  # subgroup_id -> parent_id
-    all_group_ids = set(groups.keys())
+    sibling_map = {}  # sibling prefix -> [group_ids]
 
-    # Identify parent-subgroup relationships
-    for group_id in all_group_ids:
-        # Check if this could be a subgroup (ends with letter)
+    # Single pass in input order: slice each letter-suffixed ID once and use
+    # the prefix both for sibling grouping (e.g., BAE2A, BAE2B -> BAE2, the
+    # parent need not exist) and for parent detection (prefix is a group).
+    for group_id in groups:
         if len(group_id) > 1 and group_id[-1].isalpha():
-            # Try to find parent by removing last character
-            potential_parent = group_id[:-1]
+            prefix = group_id[:-1]
+            sibling_map.setdefault(prefix, []).append(group_id)
 
-            if potential_parent in all_group_ids:
+            if prefix in groups:
                 # This is a subgroup!
-                parents.add(potential_parent)
-                parent_map[group_id] = potential_parent
-
-                if potential_parent not in subgroups_dict:
-                    subgroups_dict[potential_parent] = []
-                subgroups_dict[potential_parent].append(group_id)
+                parent_map[group_id] = prefix
+                subgroups_dict.setdefault(prefix, []).append(group_id)
+        else:
+            sibling_map[group_id] = [group_id]
+
+    # Annotate groups with their side of the parent <-> subgroup index
+    for group_id, group in groups.items():
+        group.parent_id = parent_map.get(group_id)
+        group.subgroup_ids = tuple(subgroups_dict.get(group_id, ()))
+
+    # Transitive closure of parent_map, computed once so that callers never
+    # walk parent chains (a subgroup can itself have subgroups, e.g. BAE2AB)
+    ancestors = {}  # subgroup_id -> (parent, grandparent, ...)
+    descendants = {}  # parent_id -> all transitive subgroups
+    for group_id, parent_id in parent_map.items():
+        chain = []
+        while parent_id is not None:
+            chain.append(parent_id)
+            descendants.setdefault(parent_id, []).append(group_id)
+            parent_id = parent_map.get(parent_id)
+        ancestors[group_id] = tuple(chain)
 
     # Identify standalone groups (neither parent nor subgroup)
-    parents_list = sorted(list(parents))
-    all_subgroups = set(parent_map.keys())
-    standalone = sorted(list(all_group_ids - parents - all_subgroups))
+    parents_list = sorted(subgroups_dict)
+    standalone = sorted(
+        group_id
+        for group_id in groups
+        if group_id not in subgroups_dict and group_id not in parent_map
+    )
 
     return {
         "parents": parents_list,
         "subgroups": subgroups_dict,
         "parent_map": parent_map,
+        "ancestors": ancestors,
+        "descendants": {k: tuple(v) for k, v in descendants.items()},
         "standalone": standalone,
+        "sibling_map": sibling_map,
     }
 
 
 def is_parent_group(group_id: str, hierarchy: Dict) -> bool:
     """Check if a group is a parent group."""
-    return group_id in hierarchy["parents"]
+    # Parents are exactly the keys of "subgroups": O(1) instead of a list scan
+    return group_id in hierarchy["subgroups"]
 
 
 def is_subgroup(group_id: str, hierarchy: Dict) -> bool:
@@ -85,6 +122,16 @@ def get_parent(group_id: str, hierarchy: Dict) -> str:
     return hierarchy["parent_map"].get(group_id)
 
 
+def get_ancestors(group_id: str, hierarchy: Dict) -> Tuple[str, ...]:
+    """Get all ancestor group IDs of a subgroup, nearest first."""
+    return hierarchy["ancestors"].get(group_id, ())
+
+
+def get_descendants(group_id: str, hierarchy: Dict) -> Tuple[str, ...]:
+    """Get all transitive subgroup IDs of a group."""
+    return hierarchy["descendants"].get(group_id, ())
+
+
 def get_subgroups(parent_id: str, hierarchy: Dict) -> List[str]:
     """Get list of subgroup IDs for a parent."""
     return hierarchy["subgroups"].get(parent_id, [])
@@ -20,3 +20,23 @@ def create_individual(gene_list: List[SessionGene]):
         creator.Individual: A new individual initialized with the provided genes.
     """
     return creator.Individual(gene_list)
+
+
+def clone_individual(individual):
+    """
+    Copy an individual gene by gene, carrying over its fitness.
+
+    Registered as the toolbox "clone" in place of DEAP's default deepcopy.
+    The result is equivalent (independent genes, same fitness values) but
+    uses SessionGene.clone() instead of walking every object through
+    copy.deepcopy.
+
+    Args:
+        individual (creator.Individual): Individual to copy.
+
+    Returns:
+        creator.Individual: An independent copy of the individual.
+    """
+    clone = type(individual)(gene.clone() for gene in individual)
+    clone.fitness.wvalues = individual.fitness.wvalues
+    return clone
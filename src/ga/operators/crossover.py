@@ -1,8 +1,21 @@
-import random
 from typing import List
+
+import numpy as np
+
+from src.ga.rng import get_rng
 from src.ga.sessiongene import SessionGene
 
 
+def _swap_attributes(gene1: SessionGene, gene2: SessionGene) -> None:
+    """
+    Swap ONLY mutable attributes (NOT course_id or group_ids).
+    This preserves the fundamental chromosome structure.
+    """
+    gene1.instructor_id, gene2.instructor_id = gene2.instructor_id, gene1.instructor_id
+    gene1.room_id, gene2.room_id = gene2.room_id, gene1.room_id
+    gene1.quanta, gene2.quanta = gene2.quanta, gene1.quanta
+
+
 def crossover_course_group_aware(
     ind1: List[SessionGene], ind2: List[SessionGene], cx_prob: float = 0.5
 ):
@@ -10,8 +23,8 @@ def crossover_course_group_aware(
     Position-Independent Crossover that preserves (course, group) structure.
 
     Instead of swapping entire genes by index, this operator matches genes by their
-    (course_id, group_ids) identity and swaps ONLY mutable attributes (instructor,
-    room, time slots). This ensures the fundamental (course, group) enrollment
+    (course_id, course_type, group_ids) identity and swaps ONLY mutable attributes
+    (instructor, room, time slots). This ensures the fundamental (course, group) enrollment
     structure is never corrupted, even if gene positions differ between individuals.
 
     CRITICAL: This is the recommended crossover for timetabling problems where
@@ -43,10 +56,26 @@ def crossover_course_group_aware(
     """
     from config.ga_params import VALIDATE_POPULATION_INTEGRITY
 
-    # Build lookup tables: (course_id, tuple(sorted(group_ids))) -> gene
-    # We sort group_ids to ensure consistent key regardless of list order
-    gene_map1 = {(gene.course_id, tuple(sorted(gene.group_ids))): gene for gene in ind1}
-    gene_map2 = {(gene.course_id, tuple(sorted(gene.group_ids))): gene for gene in ind2}
+    # Draw all swap decisions as one mask instead of one random() per key,
+    # from the shared generator (reseeded by the scheduler)
+    rng = get_rng()
+
+    # Fast path: operators only edit genes in place, so individuals normally
+    # keep the same gene order. When every position holds the same
+    # (course, group) identity, pair genes by index and skip the lookup maps.
+    if len(ind1) == len(ind2) and all(
+        gene1.identity_key == gene2.identity_key for gene1, gene2 in zip(ind1, ind2)
+    ):
+        swap_mask = rng.random(len(ind1)) < cx_prob
+        for idx in np.flatnonzero(swap_mask).tolist():
+            _swap_attributes(ind1[idx], ind2[idx])
+        return ind1, ind2
+
+    # Build lookup tables: identity_key -> gene. The key is
+    # (course_id, course_type, sorted group_ids), memoized on the gene, so
+    # theory and practical sessions of one course no longer collide
+    gene_map1 = {gene.identity_key: gene for gene in ind1}
+    gene_map2 = {gene.identity_key: gene for gene in ind2}
 
     # Verify both individuals have same (course, group) pairs
     # This catches any corruption early with a clear error message
@@ -69,25 +98,18 @@ def crossover_course_group_aware(
 
     # For each (course, group) pair, probabilistically swap ATTRIBUTES
     # If validation is disabled, only swap for common keys (intersection)
+    # (filtered in ind1 order so mask draws map to genes deterministically)
     keys_to_process = (
-        gene_map1.keys()
+        list(gene_map1)
         if VALIDATE_POPULATION_INTEGRITY
-        else (set(gene_map1.keys()) & set(gene_map2.keys()))
+        else [key for key in gene_map1 if key in gene_map2]
     )
 
-    for key in keys_to_process:
-        if random.random() < cx_prob:
-            gene1 = gene_map1[key]
-            gene2 = gene_map2[key]
+    swap_mask = rng.random(len(keys_to_process)) < cx_prob
 
-            # Swap ONLY mutable attributes (NOT course_id or group_ids)
-            # This preserves the fundamental chromosome structure
-            gene1.instructor_id, gene2.instructor_id = (
-                gene2.instructor_id,
-                gene1.instructor_id,
-            )
-            gene1.room_id, gene2.room_id = gene2.room_id, gene1.room_id
-            gene1.quanta, gene2.quanta = gene2.quanta, gene1.quanta
+    for idx in np.flatnonzero(swap_mask).tolist():
+        key = keys_to_process[idx]
+        _swap_attributes(gene_map1[key], gene_map2[key])
 
     return ind1, ind2
 
@@ -116,10 +138,13 @@ def crossover_uniform(
     Returns:
         tuple: (ind1, ind2) with swapped genes
     """
-    for i in range(len(ind1)):
-        if random.random() < cx_prob:
-            # Swap ENTIRE genes between the two individuals
-            # DANGER: If gene[i] in ind1 ≠ gene[i] in ind2, this creates corruption
-            ind1[i], ind2[i] = ind2[i], ind1[i]
+    # One batched draw for every position, from the shared generator
+    rng = get_rng()
+    swap_mask = rng.random(min(len(ind1), len(ind2))) < cx_prob
+
+    for i in np.flatnonzero(swap_mask).tolist():
+        # Swap ENTIRE genes between the two individuals
+        # DANGER: If gene[i] in ind1 ≠ gene[i] in ind2, this creates corruption
+        ind1[i], ind2[i] = ind2[i], ind1[i]
 
     return ind1, ind2  # Return after processing ALL genes
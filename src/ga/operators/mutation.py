@@ -1,10 +1,23 @@
 import random
+from functools import lru_cache
+import numpy as np
+from config.ga_params import HEAVY_TAILED_MUTATION, MUTATION_POWER_LAW_BETA
+from src.ga.rng import get_rng
 from src.ga.sessiongene import SessionGene
 from src.core.types import SchedulingContext
-from typing import List
+from typing import List, Optional, Tuple
 
+# Chance of keeping the current instructor / room when it is still suitable
+KEEP_INSTRUCTOR_PROB = 0.7
+KEEP_ROOM_PROB = 0.5
 
-def mutate_gene(gene: SessionGene, context: SchedulingContext) -> SessionGene:
+
+def mutate_gene(
+    gene: SessionGene,
+    context: SchedulingContext,
+    keep_instructor: Optional[bool] = None,
+    keep_room: Optional[bool] = None,
+) -> SessionGene:
     """
     Performs constraint-aware mutation on a single gene.
 
@@ -13,7 +26,15 @@ def mutate_gene(gene: SessionGene, context: SchedulingContext) -> SessionGene:
 
     This preserves the fundamental (course, group) enrollment structure
     and prevents incomplete_or_extra_sessions violations.
+
+    keep_instructor / keep_room are pre-drawn "keep if suitable" decisions
+    (see mutate_individual); when None they are drawn here.
     """
+    if keep_instructor is None:
+        keep_instructor = random.random() < KEEP_INSTRUCTOR_PROB
+    if keep_room is None:
+        keep_room = random.random() < KEEP_ROOM_PROB
+
     # Get course info for constraint-aware mutation
     # Look up using tuple key (course_id, course_type)
     course_key = (gene.course_id, gene.course_type)
@@ -26,16 +47,13 @@ def mutate_gene(gene: SessionGene, context: SchedulingContext) -> SessionGene:
     new_course_id = gene.course_id
     new_group_ids = gene.group_ids
 
-    # Find qualified instructors for this course
-    # instructor.qualified_courses now contains tuples (course_code, course_type)
-    qualified_instructors = [
-        inst_id
-        for inst_id, inst in context.instructors.items()
-        if course_key in getattr(inst, "qualified_courses", [])
-    ]
+    # Find qualified instructors for this course (precomputed on the context)
+    qualified_instructors = context.qualified_instructors_by_course.get(
+        course_key, []
+    )
 
     # If current instructor is qualified, keep with high probability (70%)
-    if gene.instructor_id in qualified_instructors and random.random() < 0.7:
+    if keep_instructor and gene.instructor_id in qualified_instructors:
         new_instructor = gene.instructor_id
     else:
         new_instructor = random.choice(
@@ -51,11 +69,11 @@ def mutate_gene(gene: SessionGene, context: SchedulingContext) -> SessionGene:
     suitable_rooms = find_suitable_rooms_for_course(
         gene.course_id, primary_group, context
     )
-    if gene.room_id in suitable_rooms and random.random() < 0.5:
+    if keep_room and gene.room_id in suitable_rooms:
         new_room = gene.room_id  # Keep current room if suitable
     else:
         new_room = random.choice(
-            suitable_rooms if suitable_rooms else list(context.rooms.keys())
+            suitable_rooms if suitable_rooms else context.room_ids
         )
 
     # ========================================
@@ -74,7 +92,7 @@ def mutate_gene(gene: SessionGene, context: SchedulingContext) -> SessionGene:
     )
 
 
-def mutate_time_quanta(gene: SessionGene, course, context) -> List[int]:
+def mutate_time_quanta(gene: SessionGene, course, context) -> Tuple[int, ...]:
     """
     Intelligently mutate time quanta while PRESERVING quanta count.
 
@@ -86,12 +104,11 @@ def mutate_time_quanta(gene: SessionGene, course, context) -> List[int]:
     # CRITICAL: Preserve the exact number of quanta
     num_quanta = len(gene.quanta)
 
-    # Validate against course requirements (sanity check)
+    # Validate against course requirements (sanity check); quanta_per_week is
+    # a required Course field, validated positive at construction
     if course:
-        expected_quanta = getattr(course, "quanta_per_week", num_quanta)
-        if num_quanta != expected_quanta:
-            # If current gene has wrong count, fix it
-            num_quanta = expected_quanta
+        # If current gene has wrong count, fix it
+        num_quanta = course.quanta_per_week
 
     # Ensure we don't exceed available quanta
     num_quanta = min(num_quanta, len(context.available_quanta))
@@ -102,23 +119,27 @@ def mutate_time_quanta(gene: SessionGene, course, context) -> List[int]:
         return gene.quanta
 
     # Try to assign consecutive quanta for better scheduling
-    available_quanta = list(context.available_quanta)
+    available_quanta = context.available_quanta_list
+
+    # Attempt to find consecutive slots. num_quanta is capped at the number
+    # of available quanta above, so max_start is never negative, and windows
+    # starting at or before it are always full-length: only the spread needs
+    # checking.
+    max_start = len(available_quanta) - num_quanta
+    if num_quanta == 1:
+        return (available_quanta[random.randint(0, max_start)],)
 
-    # Attempt to find consecutive slots
+    max_spread = num_quanta * 2
     for attempt in range(5):  # Try 5 times to find consecutive slots
-        start_idx = random.randint(0, max(0, len(available_quanta) - num_quanta))
+        start_idx = random.randint(0, max_start)
         consecutive_quanta = available_quanta[start_idx : start_idx + num_quanta]
 
-        if len(consecutive_quanta) == num_quanta:
-            # Check if quanta are somewhat consecutive (simplified check)
-            if (
-                num_quanta == 1
-                or (max(consecutive_quanta) - min(consecutive_quanta)) < num_quanta * 2
-            ):
-                return consecutive_quanta
+        # Check if quanta are somewhat consecutive (simplified check)
+        if max(consecutive_quanta) - min(consecutive_quanta) < max_spread:
+            return tuple(consecutive_quanta)
 
     # Fallback to random selection
-    return random.sample(available_quanta, min(num_quanta, len(available_quanta)))
+    return tuple(random.sample(available_quanta, num_quanta))
 
 
 def find_suitable_rooms_for_course(
@@ -127,25 +148,42 @@ def find_suitable_rooms_for_course(
     """
     Find rooms suitable for a specific course and group combination.
     Takes into account group size, course requirements, and room features.
+
+    The answer depends only on fixed course/group/room data, so it is memoized
+    on the context per (course_id, group_id); treat the list as read-only.
     """
+    cache_key = (course_id, group_id)
+    cached = context.suitable_rooms_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    suitable = _scan_suitable_rooms(course_id, group_id, context)
+    context.suitable_rooms_cache[cache_key] = suitable
+    return suitable
+
+
+def _scan_suitable_rooms(
+    course_id: str, group_id: str, context: SchedulingContext
+) -> List[str]:
+    """Uncached body of find_suitable_rooms_for_course."""
     course = context.courses.get(course_id)
     group = context.groups.get(group_id)
 
     if not course:
-        return list(context.rooms.keys())
+        return context.room_ids
 
     # Get course requirements
-    required_features = getattr(course, "required_room_features", [])
+    required_features = course.required_room_features
     room_type_needed = getattr(course, "room_type", "")
 
     # Get group size for capacity matching
-    group_size = getattr(group, "student_count", 30) if group else 30
+    group_size = group.student_count if group else 30
 
     suitable_room_ids = []
 
     for room_id, room in context.rooms.items():
-        room_features = getattr(room, "room_features", [])
-        room_capacity = getattr(room, "capacity", 50)
+        room_features = room.room_features
+        room_capacity = room.capacity
         room_type = getattr(room, "type", "Classroom")
 
         # Check capacity requirement first
@@ -189,7 +227,15 @@ def find_suitable_rooms_for_course(
             # No specific requirements, any room with adequate capacity
             suitable_room_ids.append(room_id)
 
-    return suitable_room_ids if suitable_room_ids else list(context.rooms.keys())
+    return suitable_room_ids if suitable_room_ids else context.room_ids
+
+
+@lru_cache(maxsize=None)
+def _power_law_cdf(max_alpha: int, beta: float) -> np.ndarray:
+    """Cumulative distribution of P(alpha) ~ alpha^-beta over alpha = 1..max_alpha."""
+    weights = np.arange(1, max_alpha + 1, dtype=float) ** -beta
+    cdf = np.cumsum(weights)
+    return cdf / cdf[-1]
 
 
 def mutate_individual(individual, context, mut_prob=0.2):
@@ -197,12 +243,35 @@ def mutate_individual(individual, context, mut_prob=0.2):
     Applies constraint-aware mutation to an individual.
     Reduced mutation probability to preserve good structures.
 
+    With HEAVY_TAILED_MUTATION enabled (config/ga_params.py), mut_prob is
+    replaced by alpha / n for this individual, alpha drawn from a power law
+    over [1, n/2].
+
     Args:
         individual: List of SessionGene
         context: Dict with instructor, rooms, available_quanta,
         mut_prob (float): Probability of mutation for each gene.
     """
-    for i in range(len(individual)):
-        if random.random() < mut_prob:
-            individual[i] = mutate_gene(individual[i], context)
+    # Draw every gene's mutation gate in one batch instead of one random()
+    # call per gene, from the shared generator (reseeded by the scheduler)
+    rng = get_rng()
+
+    if HEAVY_TAILED_MUTATION and individual:
+        n = len(individual)
+        cdf = _power_law_cdf(max(1, n // 2), MUTATION_POWER_LAW_BETA)
+        alpha = 1 + int(np.searchsorted(cdf, rng.random(), side="right"))
+        mut_prob = min(alpha, len(cdf)) / n
+
+    mutation_sites = np.flatnonzero(rng.random(len(individual)) < mut_prob)
+
+    # Likewise the per-site "keep current instructor / room" decisions
+    keep = rng.random((len(mutation_sites), 2)) < (
+        KEEP_INSTRUCTOR_PROB,
+        KEEP_ROOM_PROB,
+    )
+
+    for i, (keep_instructor, keep_room) in zip(
+        mutation_sites.tolist(), keep.tolist()
+    ):
+        individual[i] = mutate_gene(individual[i], context, keep_instructor, keep_room)
     return (individual,)  # Return as a tuple for DEAP compatibility
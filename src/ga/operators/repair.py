@@ -34,13 +34,34 @@ Usage:
     print(f"Fixed {stats['total_fixes']} violations")
 """
 
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Sequence, Set, Tuple, Union
 import random
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
 
 from src.ga.sessiongene import SessionGene
-from src.core.types import SchedulingContext
+from src.core.types import SchedulingContext, quanta_mask
 from src.encoder.quantum_time_system import QuantumTimeSystem
+from src.entities.room import ROOM_TYPE_FLEXIBILITY
+from config.time_config import quantum_to_day_and_within_day
+
+# Shared QuantumTimeSystem instance; repairs run per gene, so building the
+# day/quanta mapping on every slot search was pure overhead.
+_QTS = QuantumTimeSystem()
+
+# _DAY_AND_WITHIN[q] == quantum_to_day_and_within_day(q, _QTS), resolved once
+# so slot scoring and clustering do not rescan the day table per quantum.
+_DAY_AND_WITHIN = [
+    quantum_to_day_and_within_day(q, _QTS) for q in range(_QTS.total_quanta)
+]
+
+# Clustering scores used by _score_clustering
+_ADJACENT_SCORE = 100
+_SAME_DAY_SCORE = 10
+
+# Default for occupation-map lookups at free quanta. Shared and immutable so
+# probing a free quantum does not allocate an empty set per check.
+_EMPTY = frozenset()
 
 
 # ============================================================================
@@ -76,6 +97,7 @@ def repair_instructor_availability(
         Part-time instructors may have restricted availability.
     """
     fixes = 0
+    occupied = None  # Booking counts, built when the first gene needs repair
 
     for gene in individual:
         # Get instructor object
@@ -94,7 +116,12 @@ def repair_instructor_availability(
         if not needs_repair:
             continue
 
+        if occupied is None:
+            occupied = _build_occupancy_counts(individual)
+
         # Find valid replacement quanta (only checking instructor availability)
+        # against everyone else's bookings, then book the gene's final slot
+        _remove_gene_occupancy(occupied, gene)
         required_duration = len(gene.quanta)
         new_quanta = _find_instructor_available_slot(
             individual,
@@ -102,11 +129,15 @@ def repair_instructor_availability(
             required_duration,
             instructor,
             context.available_quanta,
+            occupied,
+            context.instructor_availability_masks.get(gene.instructor_id),
+            context.slot_starts(required_duration),
         )
 
         if new_quanta:
             gene.quanta = new_quanta
             fixes += 1
+        _add_gene_occupancy(occupied, gene)
 
     return fixes
 
@@ -117,7 +148,10 @@ def _find_instructor_available_slot(
     duration: int,
     instructor,
     available_quanta: List[int],
-) -> List[int]:
+    occupied: Dict[str, Dict[int, Set[str]]] = None,
+    availability_mask: int = None,
+    starts: Sequence[int] = None,
+) -> Tuple[int, ...]:
     """
     Find a valid time slot where instructor is available and no conflicts exist.
 
@@ -133,45 +167,63 @@ def _find_instructor_available_slot(
         duration: Required number of consecutive quanta
         instructor: Instructor entity
         available_quanta: List of all operating quanta
+        occupied: Conflict map of the other genes, if the caller maintains one
+            (see _build_occupancy_counts); built from individual otherwise
+        availability_mask: Bitmask of instructor.available_quanta (see
+            SchedulingContext.instructor_availability_masks); built if None
+        starts: Starts of all-operating slots of this duration (see
+            SchedulingContext.slot_starts); derived from available_quanta if None
 
     Returns:
-        List of quanta if valid slot found, None otherwise
+        Tuple of quanta if valid slot found, None otherwise
     """
     # Build conflict map from other genes
-    occupied = _build_occupied_quanta_map(individual, current_gene)
+    if occupied is None:
+        occupied = _build_occupied_quanta_map(individual, current_gene)
+
+    if availability_mask is None:
+        availability_mask = quanta_mask(instructor.available_quanta)
+    run = (1 << duration) - 1  # One bit per quantum of the slot
+
+    if starts is None:
+        starts = _slot_starts(available_quanta, duration)
 
     # Get room and group IDs from current gene
     room_id = current_gene.room_id
     group_ids = current_gene.group_ids
 
-    # Try to find consecutive available quanta
-    for start_q in available_quanta:
-        candidate_quanta = list(range(start_q, start_q + duration))
-
-        # Check if all quanta in range are valid operating times
-        if not all(q in available_quanta for q in candidate_quanta):
+    # Loop invariants, bound once for the scan below
+    instructor_id = instructor.instructor_id
+    occupied_instructors = occupied["instructors"]
+    occupied_rooms = occupied["rooms"]
+    occupied_groups = occupied["groups"]
+
+    # Try to find consecutive available quanta (every start is a run of valid
+    # operating times). Candidates are lazy ranges; a list is only
+    # materialized for the slot that is returned.
+    for start_q in starts:
+        # Check instructor availability (PRIMARY CHECK): all bits of the run
+        if (availability_mask >> start_q) & run != run:
             continue
 
-        # Check instructor availability (PRIMARY CHECK)
-        if not all(q in instructor.available_quanta for q in candidate_quanta):
-            continue
+        candidate_quanta = range(start_q, start_q + duration)
 
         # Check no conflicts with other genes
         conflict_free = True
         for q in candidate_quanta:
             # Instructor conflict check
-            if instructor.instructor_id in occupied["instructors"].get(q, set()):
+            if instructor_id in occupied_instructors.get(q, _EMPTY):
                 conflict_free = False
                 break
 
             # Room conflict check
-            if room_id in occupied["rooms"].get(q, set()):
+            if room_id in occupied_rooms.get(q, _EMPTY):
                 conflict_free = False
                 break
 
             # Group conflict check
             for group_id in group_ids:
-                if group_id in occupied["groups"].get(q, set()):
+                if group_id in occupied_groups.get(q, _EMPTY):
                     conflict_free = False
                     break
 
@@ -179,7 +231,7 @@ def _find_instructor_available_slot(
                 break
 
         if conflict_free:
-            return candidate_quanta
+            return tuple(candidate_quanta)
 
     return None  # No valid slot found
 
@@ -200,7 +252,8 @@ def _find_available_slot_smart(
     available_quanta: List[int],
     context: SchedulingContext,
     prefer_clustering: bool = True,
-) -> Tuple[List[int], str, str]:
+    occupied: Dict[str, Dict[int, Set[str]]] = None,
+) -> Tuple[Tuple[int, ...], str, str]:
     """
     SMART slot finder that considers alternative qualified instructors and clustering.
 
@@ -221,16 +274,15 @@ def _find_available_slot_smart(
         available_quanta: All operating quanta
         context: Scheduling context
         prefer_clustering: If True, prefer slots adjacent to existing sessions
+        occupied: Conflict map of the other genes, if the caller maintains one
+            (see _build_occupancy_counts); built from individual otherwise
 
     Returns:
         Tuple of (quanta_list, instructor_id, room_id) or (None, None, None)
     """
-    from config.time_config import quantum_to_day_and_within_day
-
-    qts = QuantumTimeSystem()
-
     # Build conflict map
-    occupied = _build_occupied_quanta_map(individual, current_gene)
+    if occupied is None:
+        occupied = _build_occupied_quanta_map(individual, current_gene)
 
     # Get all qualified instructors for this course
     course_key = (course.course_id, course.course_type)
@@ -255,6 +307,14 @@ def _find_available_slot_smart(
             if any(gid in gene.group_ids for gid in current_gene.group_ids):
                 existing_sessions.extend(gene.quanta)
 
+    # Index existing sessions by day once; every candidate is scored against it
+    existing_by_day = (
+        _within_day_by_day(existing_sessions)
+        if prefer_clustering and existing_sessions
+        else None
+    )
+    top_score = _ADJACENT_SCORE if existing_by_day else 0
+
     # Try each qualified instructor
     best_slot = None
     best_instructor = None
@@ -262,33 +322,44 @@ def _find_available_slot_smart(
     best_score = -1
 
     for inst in qualified_instructors:
+        if best_score == top_score:
+            break  # Only a strictly better score replaces the best slot
+
         # Try to find slots with this instructor
-        for start_q in available_quanta:
-            candidate_quanta = list(range(start_q, start_q + duration))
+        for start_q in context.slot_starts(duration):
+            candidate_quanta = range(start_q, start_q + duration)
 
             # Validate candidate
             if not _validate_candidate_slot(
-                candidate_quanta, available_quanta, inst, room, groups, occupied
+                candidate_quanta,
+                context.available_quanta_set,
+                inst,
+                room,
+                groups,
+                occupied,
             ):
                 continue
 
             # Score this slot based on clustering
             score = 0
-            if prefer_clustering and existing_sessions:
-                score = _score_clustering(candidate_quanta, existing_sessions, qts)
+            if existing_by_day:
+                score = _score_clustering(candidate_quanta, existing_by_day)
 
             if score > best_score:
                 best_score = score
-                best_slot = candidate_quanta
+                best_slot = tuple(candidate_quanta)
                 best_instructor = inst.instructor_id
                 best_room = room.room_id
 
+                if best_score == top_score:
+                    break  # Nothing later can score higher
+
     return (best_slot, best_instructor, best_room) if best_slot else (None, None, None)
 
 
 def _validate_candidate_slot(
-    candidate_quanta: List[int],
-    available_quanta: List[int],
+    candidate_quanta: Sequence[int],
+    available_quanta: Set[int],
     instructor,
     room,
     groups: List,
@@ -313,53 +384,63 @@ def _validate_candidate_slot(
             return False
 
     # Check no conflicts with other genes
+    instructor_id = instructor.instructor_id
+    room_id = room.room_id
+    occupied_instructors = occupied["instructors"]
+    occupied_rooms = occupied["rooms"]
+    occupied_groups = occupied["groups"]
+
     for q in candidate_quanta:
         # Instructor conflict
-        if instructor.instructor_id in occupied["instructors"].get(q, set()):
+        if instructor_id in occupied_instructors.get(q, _EMPTY):
             return False
         # Room conflict
-        if room.room_id in occupied["rooms"].get(q, set()):
+        if room_id in occupied_rooms.get(q, _EMPTY):
             return False
         # Group conflicts
         for group in groups:
-            if group.group_id in occupied["groups"].get(q, set()):
+            if group.group_id in occupied_groups.get(q, _EMPTY):
                 return False
 
     return True
 
 
+def _within_day_by_day(quanta: List[int]) -> Dict[str, Set[int]]:
+    """Index global quanta as day_name -> set of within-day quanta."""
+    by_day = defaultdict(set)
+    for q in quanta:
+        day, within_day = _DAY_AND_WITHIN[q]
+        by_day[day].add(within_day)
+    return by_day
+
+
 def _score_clustering(
-    candidate_quanta: List[int],
-    existing_sessions: List[int],
-    qts: QuantumTimeSystem,
+    candidate_quanta: Sequence[int],
+    existing_by_day: Dict[str, Set[int]],
 ) -> int:
     """
     Score how well candidate quanta cluster with existing sessions.
 
-    Higher score = better clustering (adjacent or same day).
+    Higher score = better clustering (adjacent or same day). Existing sessions
+    are passed pre-indexed by day (see _within_day_by_day), so each candidate
+    quantum costs two set probes instead of a pass over every existing quantum.
 
     Returns:
         Score: 100 for adjacent, 10 for same day, 0 otherwise
     """
-    from config.time_config import quantum_to_day_and_within_day
-
-    if not existing_sessions:
-        return 0
-
     max_score = 0
 
     for cand_q in candidate_quanta:
-        cand_day, cand_within = quantum_to_day_and_within_day(cand_q, qts)
-
-        for exist_q in existing_sessions:
-            exist_day, exist_within = quantum_to_day_and_within_day(exist_q, qts)
+        cand_day, cand_within = _DAY_AND_WITHIN[cand_q]
+        same_day = existing_by_day.get(cand_day)
+        if not same_day:
+            continue
 
-            # Adjacent quantum (best)
-            if cand_day == exist_day and abs(cand_within - exist_within) == 1:
-                max_score = max(max_score, 100)
-            # Same day (good)
-            elif cand_day == exist_day:
-                max_score = max(max_score, 10)
+        # Adjacent quantum (best)
+        if cand_within - 1 in same_day or cand_within + 1 in same_day:
+            return _ADJACENT_SCORE
+        # Same day (good)
+        max_score = _SAME_DAY_SCORE
 
     return max_score
 
@@ -372,7 +453,9 @@ def _find_available_slot(
     room,
     groups: List,
     available_quanta: List[int],
-) -> List[int]:
+    starts: Sequence[int] = None,
+    occupied: Dict[str, Dict[int, Set[str]]] = None,
+) -> Tuple[int, ...]:
     """
     Find a valid time slot where instructor, room, and all groups are available.
 
@@ -386,27 +469,39 @@ def _find_available_slot(
         room: Room entity
         groups: List of Group entities
         available_quanta: List of all operating quanta
+        starts: Starts of all-operating slots of this duration (see
+            SchedulingContext.slot_starts); derived from available_quanta if None
+        occupied: Conflict map of the other genes, if the caller maintains one
+            (see _build_occupancy_counts); built from individual otherwise
 
     Returns:
-        List of quanta if valid slot found, None otherwise
+        Tuple of quanta if valid slot found, None otherwise
     """
     # Build conflict map from other genes
-    occupied = _build_occupied_quanta_map(individual, current_gene)
+    if occupied is None:
+        occupied = _build_occupied_quanta_map(individual, current_gene)
 
-    # Try to find consecutive available quanta
-    for start_q in available_quanta:
-        candidate_quanta = list(range(start_q, start_q + duration))
+    if starts is None:
+        starts = _slot_starts(available_quanta, duration)
 
-        # Check if all quanta in range are valid
-        if not all(q in available_quanta for q in candidate_quanta):
-            continue
+    # Loop invariants, bound once for the scan below
+    instructor_quanta = instructor.available_quanta
+    room_id = room.room_id
+    room_quanta = room.available_quanta
+    occupied_rooms = occupied["rooms"]
+    occupied_groups = occupied["groups"]
+
+    # Try to find consecutive available quanta (every start is a run of
+    # valid operating times)
+    for start_q in starts:
+        candidate_quanta = range(start_q, start_q + duration)
 
         # Check instructor availability
-        if not all(q in instructor.available_quanta for q in candidate_quanta):
+        if not all(q in instructor_quanta for q in candidate_quanta):
             continue
 
         # Check room availability
-        if not all(q in room.available_quanta for q in candidate_quanta):
+        if not all(q in room_quanta for q in candidate_quanta):
             continue
 
         # Check all groups' availability
@@ -423,13 +518,13 @@ def _find_available_slot(
         conflict_free = True
         for q in candidate_quanta:
             # Room conflict check
-            if room.room_id in occupied["rooms"].get(q, set()):
+            if room_id in occupied_rooms.get(q, _EMPTY):
                 conflict_free = False
                 break
 
             # Group conflict check
             for group in groups:
-                if group.group_id in occupied["groups"].get(q, set()):
+                if group.group_id in occupied_groups.get(q, _EMPTY):
                     conflict_free = False
                     break
 
@@ -437,7 +532,7 @@ def _find_available_slot(
                 break
 
         if conflict_free:
-            return candidate_quanta
+            return tuple(candidate_quanta)
 
     return None  # No valid slot found
 
@@ -469,53 +564,64 @@ def repair_group_overlaps(
     """
     fixes = 0
 
-    # Build group occupation map: {group_id: {quantum: gene}}
-    group_schedule = defaultdict(lambda: defaultdict(list))
+    # Build group occupation map: {group_id: {quantum: gene | [genes]}}
+    group_schedule = defaultdict(dict)
 
     for gene in individual:
         for group_id in gene.group_ids:
             for q in gene.quanta:
-                group_schedule[group_id][q].append(gene)
-
-    # Detect overlaps and repair
-    for group_id, quanta_map in group_schedule.items():
-        for quantum, genes in quanta_map.items():
-            if len(genes) > 1:
-                # Overlap detected - keep first gene, repair others
-                for gene in genes[1:]:
-                    # Try to find new slot for conflicting gene
-                    course_key = (gene.course_id, gene.course_type)
-                    course = context.courses.get(course_key)
-                    instructor = context.instructors.get(gene.instructor_id)
-                    room = context.rooms.get(gene.room_id)
-                    groups = [context.groups.get(gid) for gid in gene.group_ids]
-
-                    if not all([course, instructor, room] + groups):
-                        continue
-
-                    required_duration = len(gene.quanta)
-
-                    # Use SMART slot finder (considers alternative instructors + clustering)
-                    new_quanta, new_instructor, new_room = _find_available_slot_smart(
-                        individual,
-                        gene,
-                        required_duration,
-                        course,
-                        instructor,
-                        room,
-                        groups,
-                        context.available_quanta,
-                        context,
-                        prefer_clustering=True,
-                    )
+                _add_occupant(group_schedule[group_id], q, gene)
 
-                    if new_quanta:
-                        gene.quanta = new_quanta
-                        if new_instructor and new_instructor != gene.instructor_id:
-                            gene.instructor_id = new_instructor
-                        if new_room and new_room != gene.room_id:
-                            gene.room_id = new_room
-                        fixes += 1
+    # Fetch only the overlapping buckets; nothing to repair if there are none
+    overlaps = _shared_buckets(group_schedule)
+    if not overlaps:
+        return 0
+
+    # Booking counts of the whole individual, kept current as genes move
+    occupied = _build_occupancy_counts(individual)
+
+    # Repair overlaps: keep the first gene of each bucket, move the
+    # others (each once, earliest start first)
+    for gene in _genes_to_repair(overlaps):
+        # Try to find new slot for conflicting gene
+        course_key = (gene.course_id, gene.course_type)
+        course = context.courses.get(course_key)
+        instructor = context.instructors.get(gene.instructor_id)
+        room = context.rooms.get(gene.room_id)
+        groups = [context.groups.get(gid) for gid in gene.group_ids]
+
+        if not all([course, instructor, room] + groups):
+            continue
+
+        required_duration = len(gene.quanta)
+
+        # Search against the other genes' bookings, then re-book the gene
+        _remove_gene_occupancy(occupied, gene)
+
+        # Use SMART slot finder (considers alternative instructors + clustering)
+        new_quanta, new_instructor, new_room = _find_available_slot_smart(
+            individual,
+            gene,
+            required_duration,
+            course,
+            instructor,
+            room,
+            groups,
+            context.available_quanta,
+            context,
+            prefer_clustering=True,
+            occupied=occupied,
+        )
+
+        if new_quanta:
+            gene.quanta = new_quanta
+            if new_instructor and new_instructor != gene.instructor_id:
+                gene.instructor_id = new_instructor
+            if new_room and new_room != gene.room_id:
+                gene.room_id = new_room
+            fixes += 1
+
+        _add_gene_occupancy(occupied, gene)
 
     return fixes
 
@@ -547,78 +653,92 @@ def repair_room_conflicts(
     """
     fixes = 0
 
-    # Build room occupation map: {room_id: {quantum: gene}}
-    room_schedule = defaultdict(lambda: defaultdict(list))
+    # Build room occupation map: {room_id: {quantum: gene | [genes]}}
+    room_schedule = defaultdict(dict)
 
     for gene in individual:
         for q in gene.quanta:
-            room_schedule[gene.room_id][q].append(gene)
-
-    # Detect overlaps and repair
-    for room_id, quanta_map in room_schedule.items():
-        for quantum, genes in quanta_map.items():
-            if len(genes) > 1:
-                # Double-booking detected - keep first gene, repair others
-                for gene in genes[1:]:
-                    course_key = (gene.course_id, gene.course_type)
-                    course = context.courses.get(course_key)
-                    instructor = context.instructors.get(gene.instructor_id)
-                    current_room = context.rooms.get(gene.room_id)
-                    groups = [context.groups.get(gid) for gid in gene.group_ids]
-
-                    if not all([course, instructor, current_room] + groups):
-                        continue
-
-                    # Strategy 1: Try shifting time with same room
-                    required_duration = len(gene.quanta)
-                    new_quanta = _find_available_slot(
-                        individual,
-                        gene,
-                        required_duration,
-                        instructor,
-                        current_room,
-                        groups,
-                        context.available_quanta,
-                    )
+            _add_occupant(room_schedule[gene.room_id], q, gene)
 
-                    if new_quanta:
-                        gene.quanta = new_quanta
-                        fixes += 1
-                        continue
+    # Fetch only the double-booked buckets; nothing to repair if there are none
+    double_bookings = _shared_buckets(room_schedule)
+    if not double_bookings:
+        return 0
 
-                    # Strategy 2: Try alternative room at same time
-                    alternative_room = _find_alternative_room(
-                        individual,
-                        gene,
-                        course,
-                        current_room,
-                        context.rooms,
-                        gene.quanta,
-                    )
+    # Booking counts of the whole individual, kept current as genes move
+    occupied = _build_occupancy_counts(individual)
 
-                    if alternative_room:
-                        gene.room_id = alternative_room.room_id
-                        fixes += 1
-                        continue
-
-                    # Strategy 3: Try any room at any time (last resort)
-                    for room in context.rooms.values():
-                        if _room_matches_requirements(room, course):
-                            new_quanta = _find_available_slot(
-                                individual,
-                                gene,
-                                required_duration,
-                                instructor,
-                                room,
-                                groups,
-                                context.available_quanta,
-                            )
-
-                            if new_quanta:
-                                gene.room_id = room.room_id
-                                gene.quanta = new_quanta
-                                fixes += 1
-                                break
+    # Repair double-bookings: keep the first gene of each bucket, move the
+    # others (each once, earliest start first)
+    for gene in _genes_to_repair(double_bookings):
+        course_key = (gene.course_id, gene.course_type)
+        course = context.courses.get(course_key)
+        instructor = context.instructors.get(gene.instructor_id)
+        current_room = context.rooms.get(gene.room_id)
+        groups = [context.groups.get(gid) for gid in gene.group_ids]
+
+        if not all([course, instructor, current_room] + groups):
+            continue
+
+        # Search against the other genes' bookings, then re-book the gene
+        _remove_gene_occupancy(occupied, gene)
+        try:
+            # Strategy 1: Try shifting time with same room
+            required_duration = len(gene.quanta)
+            new_quanta = _find_available_slot(
+                individual,
+                gene,
+                required_duration,
+                instructor,
+                current_room,
+                groups,
+                context.available_quanta,
+                context.slot_starts(required_duration),
+                occupied=occupied,
+            )
+
+            if new_quanta:
+                gene.quanta = new_quanta
+                fixes += 1
+                continue
+
+            # Strategy 2: Try alternative room at same time
+            alternative_room = _find_alternative_room(
+                individual,
+                gene,
+                course,
+                current_room,
+                context.rooms,
+                gene.quanta,
+                occupied=occupied,
+            )
+
+            if alternative_room:
+                gene.room_id = alternative_room.room_id
+                fixes += 1
+                continue
+
+            # Strategy 3: Try any room at any time (last resort)
+            for room in _matching_rooms(course, context):
+                new_quanta = _find_available_slot(
+                    individual,
+                    gene,
+                    required_duration,
+                    instructor,
+                    room,
+                    groups,
+                    context.available_quanta,
+                    context.slot_starts(required_duration),
+                    occupied=occupied,
+                )
+
+                if new_quanta:
+                    gene.room_id = room.room_id
+                    gene.quanta = new_quanta
+                    fixes += 1
+                    break
+        finally:
+            _add_gene_occupancy(occupied, gene)
 
     return fixes
 
@@ -630,6 +750,7 @@ def _find_alternative_room(
     current_room,
     all_rooms: Dict,
     desired_quanta: List[int],
+    occupied: Dict[str, Dict[int, Set[str]]] = None,
 ) -> object:
     """
     Find alternative room with same features, available at desired time.
@@ -641,11 +762,14 @@ def _find_alternative_room(
         current_room: Current (conflicting) room
         all_rooms: Dictionary of all available rooms
         desired_quanta: Desired time slots
+        occupied: Conflict map of the other genes, if the caller maintains one
+            (see _build_occupancy_counts); built from individual otherwise
 
     Returns:
         Room object if suitable alternative found, None otherwise
     """
-    occupied = _build_occupied_quanta_map(individual, gene)
+    if occupied is None:
+        occupied = _build_occupied_quanta_map(individual, gene)
 
     for room in all_rooms.values():
         if room.room_id == current_room.room_id:
@@ -662,7 +786,7 @@ def _find_alternative_room(
         # Check no conflicts with other genes
         conflict_free = True
         for q in desired_quanta:
-            if room.room_id in occupied["rooms"].get(q, set()):
+            if room.room_id in occupied["rooms"].get(q, _EMPTY):
                 conflict_free = False
                 break
 
@@ -688,28 +812,38 @@ def _room_matches_requirements(room, course) -> bool:
     Returns:
         True if room is suitable, False otherwise
     """
-    # Get normalized feature strings
-    required = getattr(course, "required_room_features", "classroom")
-    room_feature = getattr(room, "room_features", "classroom")
+    required = course.required_room_features
+    room_feature = room.room_features
 
-    # Normalize to lowercase strings
-    required_str = (
-        (required if isinstance(required, str) else str(required)).lower().strip()
-    )
-    room_str = (
-        (room_feature if isinstance(room_feature, str) else str(room_feature))
-        .lower()
-        .strip()
+    return _features_compatible(
+        required if isinstance(required, str) else str(required),
+        room_feature if isinstance(room_feature, str) else str(room_feature),
+        course.course_type,
     )
 
+
+@lru_cache(maxsize=4096)
+def _features_compatible(required: str, room_feature: str, course_type: str) -> bool:
+    """
+    Feature-string part of _room_matches_requirements, memoized.
+
+    The answer only depends on the two feature strings and the course type,
+    of which there are a handful of distinct values, while repairs ask it
+    for every (room, gene) pair they consider.
+    """
+    # Normalize to lowercase strings
+    required_str = required.lower().strip()
+    room_str = room_feature.lower().strip()
+
     # PRIORITY 1: Exact match
     if room_str == required_str:
         return True
 
-    # PRIORITY 2: Use Room's built-in flexible matching
-    if hasattr(room, "is_suitable_for_course_type"):
-        if room.is_suitable_for_course_type(required_str):
-            return True
+    # PRIORITY 2: Room's flexible matching (Room.is_suitable_for_course_type)
+    if room_feature == required_str or room_feature in ROOM_TYPE_FLEXIBILITY.get(
+        required_str, ()
+    ):
+        return True
 
     # PRIORITY 3: Additional fallback compatibility rules
     # Lab courses: Accept any lab variant
@@ -729,18 +863,73 @@ def _room_matches_requirements(room, course) -> bool:
             return True
 
     # Practical courses without specific requirements
-    if course.course_type == "practical":
+    if course_type == "practical":
         if any(lab_type in room_str for lab_type in ["lab", "practical", "workshop"]):
             return True
 
     # Theory courses without specific requirements
-    if course.course_type == "theory":
+    if course_type == "theory":
         if room_str in ["classroom", "lecture", "auditorium", "seminar", "tutorial"]:
             return True
 
     return False
 
 
+def _matching_rooms(course, context: SchedulingContext) -> List:
+    """
+    Rooms satisfying course's requirements, in context.rooms order.
+
+    Memoized per course on context.rooms_for_course; treat as read-only.
+    """
+    course_key = (course.course_id, course.course_type)
+    rooms = context.rooms_for_course.get(course_key)
+    if rooms is None:
+        rooms = [
+            room
+            for room in context.rooms.values()
+            if _room_matches_requirements(room, course)
+        ]
+        context.rooms_for_course[course_key] = rooms
+    return rooms
+
+
+def _ranked_rooms(course, context: SchedulingContext) -> List:
+    """
+    All rooms ordered by match quality for course: exact feature match,
+    then flexible match, then the rest, each in context.rooms order.
+
+    Memoized per course on context.ranked_rooms_for_course; treat as read-only.
+    """
+    course_key = (course.course_id, course.course_type)
+    rooms = context.ranked_rooms_for_course.get(course_key)
+    if rooms is None:
+        required = course.required_room_features
+        required_str = (
+            (required if isinstance(required, str) else str(required)).lower().strip()
+        )
+
+        exact_match_rooms = []
+        flexible_match_rooms = []
+        fallback_rooms = []
+        for room in context.rooms.values():
+            room_str = room.room_features
+            room_str_normalized = (
+                (room_str if isinstance(room_str, str) else str(room_str))
+                .lower()
+                .strip()
+            )
+            if room_str_normalized == required_str:
+                exact_match_rooms.append(room)
+            elif _room_matches_requirements(room, course):
+                flexible_match_rooms.append(room)
+            else:
+                fallback_rooms.append(room)
+
+        rooms = exact_match_rooms + flexible_match_rooms + fallback_rooms
+        context.ranked_rooms_for_course[course_key] = rooms
+    return rooms
+
+
 # ============================================================================
 # 4. INSTRUCTOR CONFLICT REPAIRS (Priority 4)
 # ============================================================================
@@ -763,51 +952,62 @@ def repair_instructor_conflicts(
     """
     fixes = 0
 
-    # Build instructor occupation map: {instructor_id: {quantum: gene}}
-    instructor_schedule = defaultdict(lambda: defaultdict(list))
+    # Build instructor occupation map: {instructor_id: {quantum: gene | [genes]}}
+    instructor_schedule = defaultdict(dict)
 
     for gene in individual:
         for q in gene.quanta:
-            instructor_schedule[gene.instructor_id][q].append(gene)
-
-    # Detect overlaps and repair
-    for instructor_id, quanta_map in instructor_schedule.items():
-        for quantum, genes in quanta_map.items():
-            if len(genes) > 1:
-                # Overlap detected - keep first gene, repair others
-                for gene in genes[1:]:
-                    course_key = (gene.course_id, gene.course_type)
-                    course = context.courses.get(course_key)
-                    instructor = context.instructors.get(gene.instructor_id)
-                    room = context.rooms.get(gene.room_id)
-                    groups = [context.groups.get(gid) for gid in gene.group_ids]
-
-                    if not all([course, instructor, room] + groups):
-                        continue
-
-                    required_duration = len(gene.quanta)
-
-                    # Use SMART slot finder (considers alternative instructors + clustering)
-                    new_quanta, new_instructor, new_room = _find_available_slot_smart(
-                        individual,
-                        gene,
-                        required_duration,
-                        course,
-                        instructor,
-                        room,
-                        groups,
-                        context.available_quanta,
-                        context,
-                        prefer_clustering=True,
-                    )
+            _add_occupant(instructor_schedule[gene.instructor_id], q, gene)
 
-                    if new_quanta:
-                        gene.quanta = new_quanta
-                        if new_instructor and new_instructor != gene.instructor_id:
-                            gene.instructor_id = new_instructor
-                        if new_room and new_room != gene.room_id:
-                            gene.room_id = new_room
-                        fixes += 1
+    # Fetch only the overlapping buckets; nothing to repair if there are none
+    overlaps = _shared_buckets(instructor_schedule)
+    if not overlaps:
+        return 0
+
+    # Booking counts of the whole individual, kept current as genes move
+    occupied = _build_occupancy_counts(individual)
+
+    # Repair overlaps: keep the first gene of each bucket, move the
+    # others (each once, earliest start first)
+    for gene in _genes_to_repair(overlaps):
+        course_key = (gene.course_id, gene.course_type)
+        course = context.courses.get(course_key)
+        instructor = context.instructors.get(gene.instructor_id)
+        room = context.rooms.get(gene.room_id)
+        groups = [context.groups.get(gid) for gid in gene.group_ids]
+
+        if not all([course, instructor, room] + groups):
+            continue
+
+        required_duration = len(gene.quanta)
+
+        # Search against the other genes' bookings, then re-book the gene
+        _remove_gene_occupancy(occupied, gene)
+
+        # Use SMART slot finder (considers alternative instructors + clustering)
+        new_quanta, new_instructor, new_room = _find_available_slot_smart(
+            individual,
+            gene,
+            required_duration,
+            course,
+            instructor,
+            room,
+            groups,
+            context.available_quanta,
+            context,
+            prefer_clustering=True,
+            occupied=occupied,
+        )
+
+        if new_quanta:
+            gene.quanta = new_quanta
+            if new_instructor and new_instructor != gene.instructor_id:
+                gene.instructor_id = new_instructor
+            if new_room and new_room != gene.room_id:
+                gene.room_id = new_room
+            fixes += 1
+
+        _add_gene_occupancy(occupied, gene)
 
     return fixes
 
@@ -840,6 +1040,10 @@ def repair_instructor_qualifications(
     """
     fixes = 0
 
+    # Booking counts of the whole individual, built on first use and kept
+    # current as instructors are reassigned
+    occupied = None
+
     for gene in individual:
         course_key = (gene.course_id, gene.course_type)
         course = context.courses.get(course_key)
@@ -857,7 +1061,9 @@ def repair_instructor_qualifications(
         if not qualified_ids:
             continue  # No qualified instructors available (data limitation)
 
-        # Find qualified instructor available at this time
+        # Find qualified instructor available at this time. The occupation
+        # map is only built once a candidate passes the availability check.
+        removed = False
         for qualified_id in qualified_ids:
             qualified_instructor = context.instructors.get(qualified_id)
             if not qualified_instructor:
@@ -866,11 +1072,15 @@ def repair_instructor_qualifications(
             # Check if qualified instructor is available at all gene quanta
             if all(q in qualified_instructor.available_quanta for q in gene.quanta):
                 # Check no conflict with other genes
-                occupied = _build_occupied_quanta_map(individual, gene)
+                if occupied is None:
+                    occupied = _build_occupancy_counts(individual)
+                if not removed:
+                    _remove_gene_occupancy(occupied, gene)
+                    removed = True
                 conflict_free = True
 
                 for q in gene.quanta:
-                    if qualified_id in occupied["instructors"].get(q, set()):
+                    if qualified_id in occupied["instructors"].get(q, _EMPTY):
                         conflict_free = False
                         break
 
@@ -880,6 +1090,9 @@ def repair_instructor_qualifications(
                     fixes += 1
                     break
 
+        if removed:
+            _add_gene_occupancy(occupied, gene)
+
     return fixes
 
 
@@ -910,6 +1123,10 @@ def repair_room_type_mismatches(
     """
     fixes = 0
 
+    # Booking counts of the whole individual, built on first use and kept
+    # current as genes move
+    occupied = None
+
     for gene in individual:
         course_key = (gene.course_id, gene.course_type)
         course = context.courses.get(course_key)
@@ -922,27 +1139,41 @@ def repair_room_type_mismatches(
         if _room_matches_requirements(current_room, course):
             continue  # Already correct type
 
+        # Search against the other genes' bookings, then re-book the gene
+        if occupied is None:
+            occupied = _build_occupancy_counts(individual)
+        _remove_gene_occupancy(occupied, gene)
+
         # Strategy 1: Find suitable room at current time
-        suitable_room = _find_suitable_room_for_gene(individual, gene, course, context)
+        suitable_room = _find_suitable_room_for_gene(
+            individual, gene, course, context, occupied
+        )
 
         if suitable_room:
             gene.room_id = suitable_room.room_id
             fixes += 1
-            continue
+        else:
+            # Strategy 2: Try time-shifting to find slots with suitable rooms
+            # Only attempt if we couldn't find a suitable room at current time
+            shifted = _try_time_shift_for_better_room(
+                individual, gene, course, context, occupied
+            )
 
-        # Strategy 2: Try time-shifting to find slots with suitable rooms
-        # Only attempt if we couldn't find a suitable room at current time
-        shifted = _try_time_shift_for_better_room(individual, gene, course, context)
+            if shifted:
+                fixes += 1
+                # Note: gene.room_id and gene.quanta are modified by _try_time_shift_for_better_room
 
-        if shifted:
-            fixes += 1
-            # Note: gene.room_id and gene.quanta are modified by _try_time_shift_for_better_room
+        _add_gene_occupancy(occupied, gene)
 
     return fixes
 
 
 def _find_suitable_room_for_gene(
-    individual: List[SessionGene], gene: SessionGene, course, context: SchedulingContext
+    individual: List[SessionGene],
+    gene: SessionGene,
+    course,
+    context: SchedulingContext,
+    occupied: Dict[str, Dict[int, Set[str]]] = None,
 ) -> object:
     """
     Find a room that matches course requirements and is available at gene's time.
@@ -957,90 +1188,62 @@ def _find_suitable_room_for_gene(
         gene: Gene needing room reassignment
         course: Course entity
         context: Scheduling context
+        occupied: Conflict map of the other genes, if the caller maintains one
+            (see _build_occupancy_counts); built from individual otherwise
 
     Returns:
         Room object if suitable room found, None otherwise
     """
-    occupied = _build_occupied_quanta_map(individual, gene)
-
-    # Get required features and enrolled group sizes for capacity check
-    required_features = getattr(course, "required_room_features", "classroom")
-    required_str = (
-        (
-            required_features
-            if isinstance(required_features, str)
-            else str(required_features)
-        )
-        .lower()
-        .strip()
-    )
+    if occupied is None:
+        occupied = _build_occupied_quanta_map(individual, gene)
 
     # Calculate minimum capacity needed
     min_capacity = 30  # default
     for group_id in gene.group_ids:
         group = context.groups.get(group_id)
         if group:
-            group_size = getattr(group, "student_count", 30)
+            group_size = group.student_count
             min_capacity = max(min_capacity, group_size)
 
-    # Categorize rooms by match quality
-    exact_match_rooms = []
-    flexible_match_rooms = []
-    fallback_rooms = []
+    # Bitmask of the gene's quanta, tested against each room's availability
+    need = quanta_mask(gene.quanta)
+    room_masks = context.room_availability_masks
 
-    for room in context.rooms.values():
+    # Rooms come ranked by match quality (exact > flexible > any), so the
+    # first usable one is the best available room
+    for room in _ranked_rooms(course, context):
         # Skip current room
         if room.room_id == gene.room_id:
             continue
 
         # Check capacity (hard constraint)
-        room_capacity = getattr(room, "capacity", 50)
+        room_capacity = room.capacity
         if room_capacity < min_capacity:
             continue
 
         # Check if room is available at all gene quanta
-        if not all(q in room.available_quanta for q in gene.quanta):
+        if room_masks[room.room_id] & need != need:
             continue
 
         # Check no conflicts with other genes
         conflict_free = True
         for q in gene.quanta:
-            if room.room_id in occupied["rooms"].get(q, set()):
+            if room.room_id in occupied["rooms"].get(q, _EMPTY):
                 conflict_free = False
                 break
 
-        if not conflict_free:
-            continue
-
-        # Categorize by match quality
-        room_str = getattr(room, "room_features", "classroom")
-        room_str_normalized = (
-            (room_str if isinstance(room_str, str) else str(room_str)).lower().strip()
-        )
-
-        # Exact match
-        if room_str_normalized == required_str:
-            exact_match_rooms.append(room)
-        # Flexible match
-        elif _room_matches_requirements(room, course):
-            flexible_match_rooms.append(room)
-        # Fallback (any available room with capacity)
-        else:
-            fallback_rooms.append(room)
-
-    # Return best available room (prioritized)
-    if exact_match_rooms:
-        return exact_match_rooms[0]
-    if flexible_match_rooms:
-        return flexible_match_rooms[0]
-    if fallback_rooms:
-        return fallback_rooms[0]
+        if conflict_free:
+            return room
 
     return None
 
 
 def _try_time_shift_for_better_room(
-    individual: List[SessionGene], gene: SessionGene, course, context: SchedulingContext
+    individual: List[SessionGene],
+    gene: SessionGene,
+    course,
+    context: SchedulingContext,
+    occupied: Dict[str, Dict[int, Set[str]]] = None,
 ) -> bool:
     """
     Attempt to shift gene's time to a slot where suitable rooms are available.
@@ -1052,30 +1255,32 @@ def _try_time_shift_for_better_room(
         gene: Gene needing both time and room reassignment
         course: Course entity
         context: Scheduling context
+        occupied: Conflict map of the other genes, if the caller maintains one
+            (see _build_occupancy_counts); built from individual otherwise
 
     Returns:
         True if successfully shifted time and assigned suitable room, False otherwise
     """
-    occupied = _build_occupied_quanta_map(individual, gene)
+    if occupied is None:
+        occupied = _build_occupied_quanta_map(individual, gene)
     required_duration = len(gene.quanta)
 
     # Get required features
-    required_features = getattr(course, "required_room_features", "classroom")
+    required_features = course.required_room_features
 
     # Calculate minimum capacity
     min_capacity = 30
     for group_id in gene.group_ids:
         group = context.groups.get(group_id)
         if group:
-            group_size = getattr(group, "student_count", 30)
+            group_size = group.student_count
             min_capacity = max(min_capacity, group_size)
 
     # Find suitable rooms (don't worry about time conflicts yet)
     suitable_rooms = [
         room
-        for room in context.rooms.values()
-        if _room_matches_requirements(room, course)
-        and getattr(room, "capacity", 50) >= min_capacity
+        for room in _matching_rooms(course, context)
+        if room.capacity >= min_capacity
     ]
 
     if not suitable_rooms:
@@ -1088,38 +1293,38 @@ def _try_time_shift_for_better_room(
     if not instructor or not all(groups):
         return False
 
+    # Availability bitmasks of the instructor and groups (see quanta_mask)
+    instructor_mask = context.instructor_availability_masks[gene.instructor_id]
+    group_masks = [context.group_availability_masks[gid] for gid in gene.group_ids]
+
     # Try different time slots
-    available_quanta_list = sorted(context.available_quanta)
+    available_quanta_list = context.available_quanta_sorted
+    room_masks = context.room_availability_masks
 
     for start_idx in range(len(available_quanta_list) - required_duration + 1):
         candidate_quanta = available_quanta_list[
             start_idx : start_idx + required_duration
         ]
+        need = quanta_mask(candidate_quanta)
 
         # Check if instructor is available
-        if not all(q in instructor.available_quanta for q in candidate_quanta):
+        if instructor_mask & need != need:
             continue
 
         # Check if all groups are available
-        groups_available = True
-        for group in groups:
-            if not all(q in group.available_quanta for q in candidate_quanta):
-                groups_available = False
-                break
-
-        if not groups_available:
+        if any(group_mask & need != need for group_mask in group_masks):
             continue
 
         # Check for conflicts with other genes
         has_conflict = False
         for q in candidate_quanta:
             # Check instructor conflicts
-            if gene.instructor_id in occupied["instructors"].get(q, set()):
+            if gene.instructor_id in occupied["instructors"].get(q, _EMPTY):
                 has_conflict = True
                 break
             # Check group conflicts
             for group_id in gene.group_ids:
-                if group_id in occupied["groups"].get(q, set()):
+                if group_id in occupied["groups"].get(q, _EMPTY):
                     has_conflict = True
                     break
             if has_conflict:
@@ -1130,13 +1335,13 @@ def _try_time_shift_for_better_room(
 
         # Try to find a suitable room available at this time
         for room in suitable_rooms:
-            if not all(q in room.available_quanta for q in candidate_quanta):
+            if room_masks[room.room_id] & need != need:
                 continue
 
             # Check room conflicts
             room_conflict = False
             for q in candidate_quanta:
-                if room.room_id in occupied["rooms"].get(q, set()):
+                if room.room_id in occupied["rooms"].get(q, _EMPTY):
                     room_conflict = True
                     break
 
@@ -1177,11 +1382,17 @@ def repair_session_clustering(
     Returns:
         Number of clustering improvements made
     """
-    from config.time_config import quantum_to_day_and_within_day
-
-    qts = QuantumTimeSystem()
+    qts = _QTS
     fixes = 0
 
+    # Inverted index quantum -> genes occupying it, built once and kept in sync
+    # on every accepted move, so free-slot checks only look at genes sharing
+    # the candidate quantum instead of rescanning the whole individual.
+    genes_at_quantum = defaultdict(list)
+    for other in individual:
+        for q in other.quanta:
+            genes_at_quantum[q].append(other)
+
     # Process each gene individually
     for gene in individual:
         if len(gene.quanta) < 2:
@@ -1194,7 +1405,7 @@ def repair_session_clustering(
         )  # day -> list of (within_day, global_quantum)
 
         for q in gene.quanta:
-            day, within_day = quantum_to_day_and_within_day(q, qts)
+            day, within_day = _DAY_AND_WITHIN[q]
             day_quanta_map[day].append((within_day, q))
 
         # Find isolated 1-quantum blocks on each day
@@ -1237,6 +1448,7 @@ def repair_session_clustering(
                         individual,
                         context,
                         qts,
+                        genes_at_quantum,
                     )
 
                     if success:
@@ -1257,6 +1469,7 @@ def _try_rearrange_isolated_quantum(
     individual: List[SessionGene],
     context: SchedulingContext,
     qts: QuantumTimeSystem,
+    genes_at_quantum: Dict[int, List[SessionGene]] = None,
 ) -> bool:
     """
     Try to rearrange an isolated quantum to form a better block WITHOUT changing total quanta.
@@ -1277,6 +1490,8 @@ def _try_rearrange_isolated_quantum(
         individual: Full individual to check conflicts
         context: Scheduling context
         qts: QuantumTimeSystem instance
+        genes_at_quantum: Optional quantum -> genes index; updated in place
+            when the quantum is moved
 
     Returns:
         True if successfully rearranged, False otherwise
@@ -1305,7 +1520,9 @@ def _try_rearrange_isolated_quantum(
             adj_global = day_offset + adj_within
 
             # Check if this position is free (no conflicts with other genes)
-            if _is_quantum_free_for_gene(adj_global, gene, individual, context):
+            if _is_quantum_free_for_gene(
+                adj_global, gene, individual, context, genes_at_quantum
+            ):
                 target_positions.append(adj_global)
 
     if not target_positions:
@@ -1319,7 +1536,16 @@ def _try_rearrange_isolated_quantum(
     new_quanta.remove(isolated_global)
     new_quanta.append(target_global)
 
-    gene.quanta = sorted(new_quanta)
+    gene.quanta = tuple(sorted(new_quanta))
+
+    if genes_at_quantum is not None:
+        bucket = genes_at_quantum[isolated_global]
+        for i, other in enumerate(bucket):
+            if other is gene:
+                del bucket[i]
+                break
+        genes_at_quantum[target_global].append(gene)
+
     return True
 
 
@@ -1328,6 +1554,7 @@ def _is_quantum_free_for_gene(
     gene: SessionGene,
     individual: List[SessionGene],
     context: SchedulingContext,
+    genes_at_quantum: Dict[int, List[SessionGene]] = None,
 ) -> bool:
     """
     Check if a quantum is free for all resources needed by a gene.
@@ -1343,6 +1570,8 @@ def _is_quantum_free_for_gene(
         gene: Gene that wants to use this quantum
         individual: Full individual to check conflicts
         context: Scheduling context
+        genes_at_quantum: Optional quantum -> genes index; when given only the
+            genes at ``quantum`` are checked instead of the whole individual
 
     Returns:
         True if quantum is free for all gene's resources
@@ -1355,11 +1584,13 @@ def _is_quantum_free_for_gene(
             return False
 
     # Check for conflicts with other genes
-    for other_gene in individual:
-        if other_gene is gene:
-            continue
+    if genes_at_quantum is not None:
+        candidates = genes_at_quantum.get(quantum, ())
+    else:
+        candidates = [g for g in individual if quantum in g.quanta]
 
-        if quantum not in other_gene.quanta:
+    for other_gene in candidates:
+        if other_gene is gene:
             continue
 
         # Check group overlap
@@ -1416,6 +1647,14 @@ def repair_incomplete_or_extra_sessions(
             course_group_quanta[key] += len(gene.quanta)
             course_group_genes[key].append(gene)
 
+    # Genes dropped from over-scheduled courses, by id(); the individual is
+    # filtered once at the end instead of list.remove() per gene
+    removed_ids = set()
+
+    # Booking counts of the individual, built when the first missing gene is
+    # created and kept current as genes are removed/added below
+    occupied = None
+
     # Check each course's enrolled groups
     for course_key, course in context.courses.items():
         expected_quanta = course.quanta_per_week
@@ -1439,8 +1678,11 @@ def repair_incomplete_or_extra_sessions(
                 for gene in genes_for_this:
                     if excess <= 0:
                         break
-                    if gene in individual:
-                        individual.remove(gene)
+                    # Multi-group genes are listed under each of their groups
+                    if id(gene) not in removed_ids:
+                        removed_ids.add(id(gene))
+                        if occupied is not None:
+                            _remove_gene_occupancy(occupied, gene)
                         excess -= len(gene.quanta)
                         fixes += 1
 
@@ -1449,14 +1691,22 @@ def repair_incomplete_or_extra_sessions(
                 missing = expected_quanta - actual_quanta
 
                 # Create new gene for missing quanta (if possible)
+                if occupied is None:
+                    occupied = _build_occupancy_counts(
+                        [g for g in individual if id(g) not in removed_ids]
+                    )
                 new_gene = _create_session_gene_for_course_group(
-                    course_key, group_id, missing, context, individual
+                    course_key, group_id, missing, context, individual, occupied
                 )
 
                 if new_gene:
                     individual.append(new_gene)
+                    _add_gene_occupancy(occupied, new_gene)
                     fixes += 1
 
+    if removed_ids:
+        individual[:] = [g for g in individual if id(g) not in removed_ids]
+
     return fixes
 
 
@@ -1466,6 +1716,7 @@ def _create_session_gene_for_course_group(
     required_quanta: int,
     context: SchedulingContext,
     existing_individual: List[SessionGene],
+    occupied: Dict[str, Dict[int, Set[str]]] = None,
 ) -> SessionGene:
     """
     Create a new SessionGene for a missing course-group combination.
@@ -1476,6 +1727,8 @@ def _create_session_gene_for_course_group(
         required_quanta: Number of quanta needed
         context: Scheduling context
         existing_individual: Current individual (to avoid conflicts)
+        occupied: Conflict map of existing_individual, if the caller maintains
+            one (see _build_occupancy_counts); built from it otherwise
 
     Returns:
         SessionGene if successfully created, None otherwise
@@ -1492,57 +1745,79 @@ def _create_session_gene_for_course_group(
         qualified_ids = list(context.instructors.keys())  # Fallback
 
     # Find suitable room
-    suitable_rooms = [
-        r for r in context.rooms.values() if _room_matches_requirements(r, course)
-    ]
+    suitable_rooms = _matching_rooms(course, context)
     if not suitable_rooms:
         suitable_rooms = list(context.rooms.values())  # Fallback
 
     # Try to find valid slot
-    occupied = _build_occupied_quanta_map(existing_individual)
+    if occupied is None:
+        occupied = _build_occupied_quanta_map(existing_individual)
+
+    # Free quanta of each resource as bitmasks: available and not booked by
+    # another gene. A slot start is feasible when the run of required_quanta
+    # bits from it is set in the combined mask, so infeasible
+    # (instructor, room) pairs are rejected with a few bitwise ops.
+    room_masks = context.room_availability_masks
+    busy_rooms = _occupancy_masks(occupied["rooms"])
+    busy_instructors = _occupancy_masks(occupied["instructors"])
+    busy_group = _occupancy_masks(occupied["groups"]).get(group_id, 0)
+    group_free = (
+        context.available_quanta_mask
+        & context.group_availability_masks[group_id]
+        & ~busy_group
+    )
+
+    # Least-loaded instructors and rooms with the most free quanta first
+    # (stable, so data order breaks ties): new sessions spread over the
+    # resources with the most slack instead of piling onto the first listed
+    qualified_ids = sorted(
+        qualified_ids,
+        key=lambda inst_id: busy_instructors.get(inst_id, 0).bit_count(),
+    )
+    suitable_rooms = sorted(
+        suitable_rooms,
+        key=lambda r: -(
+            room_masks[r.room_id] & ~busy_rooms.get(r.room_id, 0)
+        ).bit_count(),
+    )
 
     for instructor_id in qualified_ids:
         instructor = context.instructors.get(instructor_id)
         if not instructor:
             continue
+        instructor_free = (
+            group_free
+            & context.instructor_availability_masks[instructor_id]
+            & ~busy_instructors.get(instructor_id, 0)
+        )
+        if not instructor_free:
+            continue
 
         for room in suitable_rooms:
-            # Try to find consecutive quanta
-            for start_q in context.available_quanta:
-                candidate_quanta = list(range(start_q, start_q + required_quanta))
-
-                # Validate
-                if not all(q in context.available_quanta for q in candidate_quanta):
-                    continue
-
-                # Check availability and conflicts
-                if not all(q in instructor.available_quanta for q in candidate_quanta):
-                    continue
-                if not all(q in room.available_quanta for q in candidate_quanta):
-                    continue
-                if not all(q in group.available_quanta for q in candidate_quanta):
-                    continue
-
-                # Check no conflicts
-                conflict = False
-                for q in candidate_quanta:
-                    if (
-                        room.room_id in occupied["rooms"].get(q, set())
-                        or instructor_id in occupied["instructors"].get(q, set())
-                        or group_id in occupied["groups"].get(q, set())
-                    ):
-                        conflict = True
-                        break
+            free = (
+                instructor_free
+                & room_masks[room.room_id]
+                & ~busy_rooms.get(room.room_id, 0)
+            )
+
+            # Bit s set <=> quanta s .. s + required_quanta - 1 are all free
+            feasible_starts = free
+            for offset in range(1, required_quanta):
+                feasible_starts &= free >> offset
+            if not feasible_starts:
+                continue
 
-                if not conflict:
+            # Take the first feasible start in operating-quanta order
+            for start_q in context.slot_starts(required_quanta):
+                if feasible_starts >> start_q & 1:
                     # Create gene
                     return SessionGene(
                         course_id=course_key[0],
                         course_type=course_key[1],
                         instructor_id=instructor_id,
-                        group_ids=[group_id],
+                        group_ids=(group_id,),
                         room_id=room.room_id,
-                        quanta=candidate_quanta,
+                        quanta=tuple(range(start_q, start_q + required_quanta)),
                     )
 
     return None  # Could not create valid gene
@@ -1553,6 +1828,62 @@ def _create_session_gene_for_course_group(
 # ============================================================================
 
 
+def _genes_to_repair(
+    shared_buckets: List[List[SessionGene]],
+) -> List[SessionGene]:
+    """
+    Genes to move out of the shared buckets from _shared_buckets.
+
+    The first gene of each bucket keeps its slot; every other gene is listed
+    once, even when it clashes on several quanta. Genes are ordered by
+    earliest start, longer sessions first on ties, so repairs fill the week
+    front to back and the hardest-to-place sessions at each start go first.
+    """
+    pending = {}
+    for genes in shared_buckets:
+        for gene in genes[1:]:
+            pending.setdefault(id(gene), gene)
+    return sorted(pending.values(), key=lambda g: (min(g.quanta), -len(g.quanta)))
+
+
+def _add_occupant(
+    quanta_map: Dict[int, Union[SessionGene, List[SessionGene]]],
+    q: int,
+    gene: SessionGene,
+) -> None:
+    """
+    Record gene in the quantum q bucket of one resource's occupation map.
+
+    Nearly every bucket holds a single gene, so that gene is stored directly;
+    a list is only created once a second gene lands in the same bucket.
+    """
+    occupant = quanta_map.get(q)
+    if occupant is None:
+        quanta_map[q] = gene
+    elif isinstance(occupant, list):
+        occupant.append(gene)
+    else:
+        quanta_map[q] = [occupant, gene]
+
+
+def _shared_buckets(
+    schedule: Dict[str, Dict[int, Union[SessionGene, List[SessionGene]]]],
+) -> List[List[SessionGene]]:
+    """
+    Collect the gene lists of (resource, quantum) buckets holding more than one gene.
+
+    Conflict repairs only act on these offenders, so they iterate this list
+    instead of rescanning every bucket of the occupation map. Buckets built
+    by _add_occupant are lists exactly when they are shared.
+    """
+    return [
+        genes
+        for quanta_map in schedule.values()
+        for genes in quanta_map.values()
+        if isinstance(genes, list)
+    ]
+
+
 def _build_occupied_quanta_map(
     individual: List[SessionGene], exclude_gene: SessionGene = None
 ) -> Dict[str, Dict[int, Set[str]]]:
@@ -1576,19 +1907,98 @@ def _build_occupied_quanta_map(
         "instructors": defaultdict(set),
     }
 
+    groups = occupied["groups"]
+    rooms = occupied["rooms"]
+    instructors = occupied["instructors"]
+
     for gene in individual:
         if exclude_gene and gene is exclude_gene:
             continue
 
         for q in gene.quanta:
-            occupied["rooms"][q].add(gene.room_id)
-            occupied["instructors"][q].add(gene.instructor_id)
+            rooms[q].add(gene.room_id)
+            instructors[q].add(gene.instructor_id)
             for group_id in gene.group_ids:
-                occupied["groups"][q].add(group_id)
+                groups[q].add(group_id)
+
+    return occupied
+
+
+def _slot_starts(available_quanta, duration: int) -> List[int]:
+    """
+    Starts of every run of `duration` consecutive operating quanta, in
+    available_quanta order (uncached form of SchedulingContext.slot_starts).
+    """
+    return [
+        start
+        for start in available_quanta
+        if all(q in available_quanta for q in range(start, start + duration))
+    ]
+
+
+def _occupancy_masks(by_quantum: Dict[int, Set[str]]) -> Dict[str, int]:
+    """
+    Invert one resource section of an occupation map ({quantum: ids}) into
+    {id: bitmask of the quanta it is booked at}.
+    """
+    masks = defaultdict(int)
+    for q, entity_ids in by_quantum.items():
+        bit = 1 << q
+        for entity_id in entity_ids:
+            masks[entity_id] |= bit
+    return masks
+
 
+def _build_occupancy_counts(
+    individual: List[SessionGene],
+) -> Dict[str, Dict[int, Counter]]:
+    """
+    Occupation map of the whole individual that counts bookings.
+
+    Same shape as _build_occupied_quanta_map (membership tests work as-is),
+    but counts let a repair take one gene out with _remove_gene_occupancy
+    and book it again with _add_gene_occupancy, instead of rebuilding the
+    map for every gene it repairs.
+    """
+    occupied = {
+        "groups": defaultdict(Counter),
+        "rooms": defaultdict(Counter),
+        "instructors": defaultdict(Counter),
+    }
+    for gene in individual:
+        _add_gene_occupancy(occupied, gene)
     return occupied
 
 
+def _add_gene_occupancy(occupied: Dict[str, Dict[int, Counter]], gene) -> None:
+    """Book gene's room, instructor and groups at each of its quanta."""
+    groups = occupied["groups"]
+    rooms = occupied["rooms"]
+    instructors = occupied["instructors"]
+
+    for q in gene.quanta:
+        rooms[q][gene.room_id] += 1
+        instructors[q][gene.instructor_id] += 1
+        for group_id in gene.group_ids:
+            groups[q][group_id] += 1
+
+
+def _remove_gene_occupancy(occupied: Dict[str, Dict[int, Counter]], gene) -> None:
+    """Undo _add_gene_occupancy; ids whose count drops to zero are removed."""
+    for kind, entity_ids in (
+        ("rooms", (gene.room_id,)),
+        ("instructors", (gene.instructor_id,)),
+        ("groups", gene.group_ids),
+    ):
+        by_quantum = occupied[kind]
+        for q in gene.quanta:
+            counts = by_quantum[q]
+            for entity_id in entity_ids:
+                counts[entity_id] -= 1
+                if not counts[entity_id]:
+                    del counts[entity_id]
+
+
 # ============================================================================
 # ORCHESTRATION: Apply repairs in priority order
 # ============================================================================
@@ -134,7 +134,7 @@ def extract_course_group_relationships(
 
     for group_id, group in context.groups.items():
         # Get enrolled courses for this group (these are course_codes)
-        enrolled_courses = getattr(group, "enrolled_courses", [])
+        enrolled_courses = group.enrolled_courses
 
         for course_code in enrolled_courses:
             # Check for both theory and practical versions
@@ -305,21 +305,16 @@ def create_session_gene_with_conflict_avoidance(
 
     room = random.choice(suitable_rooms)
 
-    # Find available quanta that don't conflict
-    available_quanta = [q for q in context.available_quanta if q not in used_quanta]
-
-    if len(available_quanta) < num_quanta:
-        # Fall back to all if not enough free
-        available_quanta = list(context.available_quanta)
-
-    quanta_needed = min(num_quanta, len(available_quanta))
+    quanta_needed = min(num_quanta, len(context.available_quanta))
 
     if quanta_needed == 0:
         return None
 
-    # Assign time quanta
+    # Assign time quanta. assign_conflict_free_quanta filters out used quanta
+    # itself (falling back to all operating quanta when too few are free),
+    # so the free list is not pre-built here as well.
     assigned_quanta = assign_conflict_free_quanta(
-        quanta_needed, available_quanta, used_quanta
+        quanta_needed, context.available_quanta, used_quanta
     )
 
     if not assigned_quanta:
@@ -355,9 +350,9 @@ def create_session_gene_with_conflict_avoidance(
         course_id=actual_course_id,
         course_type=actual_course_type,
         instructor_id=instructor_id,
-        group_ids=group_ids,  # Can be multiple groups
+        group_ids=tuple(group_ids),  # Can be multiple groups
         room_id=room.room_id,
-        quanta=assigned_quanta,
+        quanta=tuple(assigned_quanta),
     )
 
     return session_gene
@@ -455,9 +450,9 @@ def create_component_session_with_conflict_avoidance(
         course_id=actual_course_id,
         course_type=actual_course_type,
         instructor_id=instructor_id,
-        group_ids=[group_id],  # Changed to list for multi-group support
+        group_ids=(group_id,),  # Tuple for multi-group support
         room_id=room.room_id,
-        quanta=assigned_quanta,
+        quanta=tuple(assigned_quanta),
     )
 
     return session_gene
@@ -490,19 +485,13 @@ def assign_conflict_free_quanta(
         # Sort quanta to find consecutive sequences
         sorted_free = sorted(free_quanta)
 
-        # Try to find consecutive slots
-        for i in range(len(sorted_free) - quanta_needed + 1):
-            consecutive_candidates = sorted_free[i : i + quanta_needed]
-
-            # Check if they are truly consecutive
-            is_consecutive = True
-            for j in range(1, len(consecutive_candidates)):
-                if consecutive_candidates[j] - consecutive_candidates[j - 1] != 1:
-                    is_consecutive = False
-                    break
-
-            if is_consecutive:
-                return consecutive_candidates
+        # Try to find consecutive slots. Operating quanta are distinct, so a
+        # sorted window is truly consecutive exactly when its ends are
+        # quanta_needed - 1 apart; only the winning window is sliced.
+        span = quanta_needed - 1
+        for i in range(len(sorted_free) - span):
+            if sorted_free[i + span] - sorted_free[i] == span:
+                return sorted_free[i : i + quanta_needed]
 
     # If no consecutive slots found or not needed, select randomly
     return random.sample(free_quanta, quanta_needed)
@@ -583,9 +572,9 @@ def create_component_session(
         course_id=actual_course_id,
         course_type=actual_course_type,
         instructor_id=instructor.instructor_id,
-        group_ids=[group_id],  # Changed to list for multi-group support
+        group_ids=(group_id,),  # Tuple for multi-group support
         room_id=room.room_id,
-        quanta=assigned_quanta,
+        quanta=tuple(assigned_quanta),
     )
 
     return session_gene
@@ -598,16 +587,13 @@ def find_qualified_instructors(course_id, context: SchedulingContext) -> List:
     Args:
         course_id: Can be plain string or (course_code, course_type) tuple
     """
-    qualified = []
-
-    for instructor in context.instructors.values():
-        # Check if instructor is qualified for this course
-        # instructor.qualified_courses now contains tuples (course_code, course_type)
-        qualified_courses = getattr(instructor, "qualified_courses", [])
-        if course_id in qualified_courses:
-            qualified.append(instructor)
-
-    return qualified
+    # instructor.qualified_courses contains (course_code, course_type) tuples;
+    # the context indexes them once, so no per-call scan of all instructors
+    instructors = context.instructors
+    return [
+        instructors[inst_id]
+        for inst_id in context.qualified_instructors_by_course.get(course_id, ())
+    ]
 
 
 def find_suitable_rooms(
@@ -630,15 +616,14 @@ def find_suitable_rooms(
     flexible_matches = []
 
     # Get required room features from course
-    required_features = getattr(course, "required_room_features", "classroom")
-    course_id = getattr(course, "course_id", "")
+    required_features = course.required_room_features
+    course_id = course.course_id
 
     # Find the group size for capacity matching
     max_group_size = 0  # Start at 0, will use min capacity if no groups found
     for group in context.groups.values():
-        if course_id in getattr(group, "enrolled_courses", []):
-            group_size = getattr(group, "student_count", 30)
-            max_group_size = max(max_group_size, group_size)
+        if course_id in group.enrolled_courses:
+            max_group_size = max(max_group_size, group.student_count)
 
     # If no enrolled groups found, use a minimal default (don't filter out small rooms)
     if max_group_size == 0:
@@ -646,13 +631,13 @@ def find_suitable_rooms(
 
     # Evaluate each room
     for room in context.rooms.values():
-        room_capacity = getattr(room, "capacity", 50)
+        room_capacity = room.capacity
 
         # Check capacity requirement (hard constraint)
         if room_capacity < max_group_size:
             continue
 
-        room_features = getattr(room, "room_features", "classroom")
+        room_features = room.room_features
 
         # Handle required_features as string (normalized during data loading)
         required_str = (
@@ -707,8 +692,8 @@ def find_suitable_rooms(
         fallback_any = []
 
         for r in context.rooms.values():
-            if getattr(r, "capacity", 50) >= max_group_size:
-                room_str = getattr(r, "room_features", "").lower().strip()
+            if r.capacity >= max_group_size:
+                room_str = r.room_features.lower().strip()
                 # Try to match course_type at least
                 if (component_type == "practical" and "practical" in room_str) or (
                     component_type in ["theory", "lecture"] and "lecture" in room_str
@@ -802,9 +787,9 @@ def generate_random_gene(
         course_id=course.course_id,
         course_type=getattr(course, "course_type", "theory"),  # Default to theory
         instructor_id=instructor.instructor_id,
-        group_ids=[group.group_id],  # Changed to list for multi-group support
+        group_ids=(group.group_id,),  # Tuple for multi-group support
         room_id=room.room_id,
-        quanta=quanta,
+        quanta=tuple(quanta),
     )
 
 
@@ -0,0 +1,35 @@
+"""
+Shared NumPy generator for the GA operators' batched random draws.
+
+Operators draw their per-gene gates in vectorized batches from this single
+generator instead of building a fresh one on every call. The generator is
+seeded from Python's ``random`` module, so a run seeded via ``random.seed``
+stays reproducible as long as the owner reseeds it at fixed points (once per
+generation in the scheduler, once per chunk in pool workers).
+
+Usage:
+    >>> from src.ga.rng import get_rng, seed_rng
+    >>> seed_rng(random.getrandbits(64))
+    >>> gates = get_rng().random(len(individual)) < mut_prob
+"""
+
+import random
+
+import numpy as np
+
+_rng = np.random.default_rng(random.getrandbits(64))
+
+
+def get_rng() -> np.random.Generator:
+    """Return the shared generator."""
+    return _rng
+
+
+def seed_rng(seed: int) -> None:
+    """
+    Reseed the shared generator in place.
+
+    Args:
+        seed: Seed for the new bit stream, normally random.getrandbits(64)
+    """
+    _rng.bit_generator.state = np.random.PCG64(seed).state
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionGene:
     """
     Each SessionGene Represents a single session in the timetable.
@@ -14,11 +14,56 @@ class SessionGene:
 
     Clean architecture: course_id is plain code (e.g., "ENME 103"),
     course_type distinguishes "theory" vs "practical".
+
+    Slotted (no per-instance __dict__): genes are created and cloned in bulk
+    every generation, so this keeps them smaller and attribute access cheaper.
+    group_ids and quanta are tuples: operators replace them rather than edit
+    them in place, so clones and mutated children can share them safely.
     """
 
     course_id: str
     course_type: str  # "theory" or "practical"
     instructor_id: str
-    group_ids: List[str]  # Changed from group_id to support multiple groups
+    group_ids: Tuple[str, ...]  # Changed from group_id to support multiple groups
     room_id: str
-    quanta: List[int]
+    quanta: Tuple[int, ...]
+
+    # Memoized structural identity (see identity_key). Not part of equality/repr.
+    _identity_key: Optional[Tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def identity_key(self) -> Tuple[str, str, Tuple[str, ...]]:
+        """
+        Structural identity of the gene: (course_id, course_type, sorted group_ids).
+
+        Course and groups are NEVER mutated by GA operators (only instructor,
+        room and quanta change), so the key is computed once and reused by
+        population validation and crossover instead of rebuilding and
+        re-sorting the tuple on every lookup.
+        """
+        key = self._identity_key
+        if key is None:
+            key = (self.course_id, self.course_type, tuple(sorted(self.group_ids)))
+            self._identity_key = key
+        return key
+
+    def clone(self) -> "SessionGene":
+        """
+        Independent copy of this gene.
+
+        Fields are ids and tuples of strings/ints, all immutable, so a shallow
+        copy is a full copy; this avoids copy.deepcopy's per-object dispatch and
+        memo bookkeeping when individuals are cloned every generation.
+        """
+        gene = SessionGene(
+            self.course_id,
+            self.course_type,
+            self.instructor_id,
+            self.group_ids,
+            self.room_id,
+            self.quanta,
+        )
+        gene._identity_key = self._identity_key
+        return gene
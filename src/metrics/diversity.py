@@ -1,3 +1,5 @@
+import numpy as np
+
 from src.ga.sessiongene import SessionGene
 from typing import List
 
@@ -41,16 +43,58 @@ def individual_distance(ind1: List[SessionGene], ind2: List[SessionGene]) -> flo
     return sum(gene_distance(g1, g2) for g1, g2 in zip(ind1, ind2)) / len(ind1)
 
 
+def _intern_gene_fields(population: List[List[SessionGene]]) -> np.ndarray:
+    """
+    Encodes every gene field compared by gene_distance as a small int.
+
+    Equal codes mean equal fields under gene_distance's rules (group_ids and
+    quanta compared as sets), so distances reduce to integer array compares.
+
+    Returns:
+        np.ndarray: Shape (num_individuals, genes_per_individual * 5).
+    """
+    genes = [gene for individual in population for gene in individual]
+    columns = []
+    for values in (
+        [g.course_id for g in genes],
+        [g.instructor_id for g in genes],
+        [frozenset(g.group_ids) for g in genes],
+        [g.room_id for g in genes],
+        [frozenset(g.quanta) for g in genes],
+    ):
+        codes = {}
+        columns.append([codes.setdefault(v, len(codes)) for v in values])
+    return np.array(columns, dtype=np.int32).T.reshape(len(population), -1)
+
+
 def average_pairwise_diversity(population: List[List[SessionGene]]) -> float:
     """
     Calculates the average pairwise diversity in a population.
 
+    Equivalent to averaging individual_distance over all pairs. When all
+    individuals have the same length (always true for the GA population)
+    the fields are interned once and each individual is compared against
+    all later ones in a single array operation.
+
     Args:
         population: List of individuals, each being a list of SessionGene.
 
     Returns:
         float: Average pairwise distance between individuals.
     """
+    n = len(population)
+    if n < 2:
+        return 0
+
+    length = len(population[0])
+    if length and all(len(ind) == length for ind in population):
+        codes = _intern_gene_fields(population)
+        differing = 0
+        for i in range(n - 1):
+            differing += int(np.count_nonzero(codes[i + 1 :] != codes[i]))
+        count = n * (n - 1) // 2
+        return differing / (5 * length) / count
+
     total = 0
     count = 0
 
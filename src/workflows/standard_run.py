@@ -27,9 +27,9 @@ from src.encoder.input_encoder import (
     link_courses_and_instructors,
 )
 from src.encoder.quantum_time_system import QuantumTimeSystem
-from src.decoder.individual_decoder import decode_individual
 from src.core.types import SchedulingContext
 from src.core.ga_scheduler import GAScheduler, GAConfig
+from src.ga.rng import seed_rng
 from src.validation import validate_input
 from src.workflows.reporting import generate_reports
 from config.constraints import HARD_CONSTRAINTS_CONFIG, SOFT_CONSTRAINTS_CONFIG
@@ -48,6 +48,7 @@ def run_standard_workflow(
     seed: int = 69,
     validate: bool = True,
     pool=None,  # NEW: Optional multiprocessing Pool for parallel evaluation
+    workers: Optional[int] = None,
 ) -> Dict:
     """
     Execute standard GA scheduling workflow.
@@ -70,6 +71,7 @@ def run_standard_workflow(
         seed: Random seed for reproducibility
         validate: Whether to validate input before running GA
         pool: Optional multiprocessing.Pool for parallel fitness evaluation
+        workers: Number of processes in pool (defaults to the CPU count)
 
     Returns:
         Dict containing:
@@ -91,8 +93,9 @@ def run_standard_workflow(
     )
     console.print()
 
-    # Set random seed
+    # Set random seed (also for the operators' shared NumPy generator)
     random.seed(seed)
+    seed_rng(seed)
     console.print(f"[dim]Random seed: {seed}[/dim]")
 
     # Create output directory
@@ -203,7 +206,9 @@ def run_standard_workflow(
     # ========================================
     console.print("[bold green]Running Genetic Algorithm...[/bold green]\n")
 
-    scheduler = GAScheduler(ga_config, context, hard_names, soft_names, pool=pool)
+    scheduler = GAScheduler(
+        ga_config, context, hard_names, soft_names, pool=pool, workers=workers
+    )
     scheduler.setup_toolbox()
     scheduler.initialize_population()
     scheduler.evolve()
@@ -215,13 +220,7 @@ def run_standard_workflow(
     console.print("[bold]Processing Results...[/bold]")
 
     best_individual = scheduler.get_best_solution()
-    decoded_schedule = decode_individual(
-        best_individual,
-        context.courses,
-        context.instructors,
-        context.groups,
-        context.rooms,
-    )
+    decoded_schedule = scheduler.decode_solution(best_individual)
 
     console.print(
         f"   Hard Violations: [yellow]{best_individual.fitness.values[0]:.0f}[/yellow]"
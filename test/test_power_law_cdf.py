@@ -0,0 +1,63 @@
+"""The power-law CDF behind heavy-tailed mutation rates."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.ga_params import MUTATION_POWER_LAW_BETA
+from src.ga.operators import mutation
+from src.ga.operators.mutation import _power_law_cdf
+from src.ga.sessiongene import SessionGene
+
+
+@pytest.mark.parametrize("max_alpha", [1, 2, 7, 50])
+@pytest.mark.parametrize("beta", [1.1, MUTATION_POWER_LAW_BETA, 3.0])
+def test_cdf_is_valid(max_alpha, beta):
+    cdf = _power_law_cdf(max_alpha, beta)
+
+    assert cdf.shape == (max_alpha,)
+    assert np.all((cdf > 0) & (cdf <= 1))
+    assert np.all(np.diff(cdf) > 0)
+    assert cdf[-1] == pytest.approx(1.0)
+
+
+def test_cdf_matches_power_law_weights():
+    max_alpha, beta = 10, MUTATION_POWER_LAW_BETA
+    weights = np.arange(1, max_alpha + 1, dtype=float) ** -beta
+
+    probs = np.diff(_power_law_cdf(max_alpha, beta), prepend=0.0)
+
+    assert probs == pytest.approx(weights / weights.sum())
+
+
+def test_larger_beta_concentrates_on_small_alpha():
+    # A steeper power law puts more mass on alpha = 1 at every prefix
+    light = _power_law_cdf(20, 1.2)
+    steep = _power_law_cdf(20, 2.5)
+
+    assert np.all(steep[:-1] > light[:-1])
+
+
+def test_mutation_uses_configured_beta(monkeypatch):
+    calls = []
+
+    class _Stop(Exception):
+        pass
+
+    def spy(max_alpha, beta):
+        calls.append((max_alpha, beta))
+        raise _Stop
+
+    monkeypatch.setattr(mutation, "HEAVY_TAILED_MUTATION", True)
+    monkeypatch.setattr(mutation, "MUTATION_POWER_LAW_BETA", 2.5)
+    monkeypatch.setattr(mutation, "_power_law_cdf", spy)
+
+    gene = SessionGene("C1", "theory", "I1", ("G1",), "R1", (0, 1))
+    with pytest.raises(_Stop):
+        mutation.mutate_individual([gene] * 8, context=None)
+
+    assert calls == [(4, 2.5)]
@@ -0,0 +1,54 @@
+"""Ordering of the genes that conflict repair moves out of shared slots."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ga.operators.repair import _genes_to_repair
+from src.ga.sessiongene import SessionGene
+
+
+def _gene(course_id, quanta):
+    return SessionGene(
+        course_id=course_id,
+        course_type="theory",
+        instructor_id="I1",
+        group_ids=("G1",),
+        room_id="R1",
+        quanta=tuple(quanta),
+    )
+
+
+def test_earliest_start_first():
+    keeper = _gene("KEEP", [0, 1, 2, 10, 11, 20])
+    late = _gene("LATE", [20, 21])
+    early = _gene("EARLY", [0])
+    middle = _gene("MIDDLE", [11, 12, 13])
+
+    buckets = [[keeper, early], [keeper, middle], [keeper, late]]
+
+    assert _genes_to_repair(buckets) == [early, middle, late]
+
+
+def test_longer_session_first_on_same_start():
+    keeper = _gene("KEEP", [5, 6, 7])
+    short = _gene("SHORT", [5])
+    long = _gene("LONG", [5, 6, 7])
+    medium = _gene("MEDIUM", [5, 6])
+
+    buckets = [[keeper, short, long, medium]]
+
+    assert _genes_to_repair(buckets) == [long, medium, short]
+
+
+def test_bucket_keepers_stay_and_genes_listed_once():
+    keeper = _gene("KEEP", [3, 4])
+    other_keeper = _gene("KEEP2", [8])
+    clash = _gene("CLASH", [3, 4])
+
+    # clash shares two quanta with keeper: still moved only once, and the
+    # first gene of each bucket is never moved
+    buckets = [[keeper, clash], [keeper, clash], [other_keeper]]
+
+    assert _genes_to_repair(buckets) == [clash]
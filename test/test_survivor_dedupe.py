@@ -0,0 +1,67 @@
+"""Parents and uncloned offspring must not take two population slots."""
+
+import io
+import random
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.constraints import HARD_CONSTRAINTS_CONFIG, SOFT_CONSTRAINTS_CONFIG
+from src.core.ga_scheduler import GAConfig, GAScheduler, _replacement_pool
+from src.ga.creator_registry import get_creator
+from src.ga.rng import seed_rng
+from src.workflows.standard_run import load_input_data
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _genome(individual):
+    return tuple(
+        (g.course_id, g.course_type, g.group_ids, g.instructor_id, g.room_id, g.quanta)
+        for g in individual
+    )
+
+
+def test_uncloned_offspring_counted_once():
+    creator = get_creator()
+    parents = [creator.Individual() for _ in range(4)]
+    children = [creator.Individual() for _ in range(2)]
+
+    # Copy-on-write selection: untouched offspring are the parent objects
+    offspring = [parents[0], children[0], parents[0], parents[3], children[1]]
+
+    combined = _replacement_pool(parents, offspring)
+
+    assert len(combined) == len({id(ind) for ind in combined})
+    assert combined == parents + children
+    assert all(a is b for a, b in zip(combined, parents + children))
+
+
+def test_evolved_population_has_no_repeated_genomes():
+    with redirect_stdout(io.StringIO()):
+        _, context = load_input_data(str(DATA_DIR))
+    hard = [n for n, c in HARD_CONSTRAINTS_CONFIG.items() if c["enabled"]]
+    soft = [n for n, c in SOFT_CONSTRAINTS_CONFIG.items() if c["enabled"]]
+
+    random.seed(3)
+    seed_rng(3)
+    # No crossover and no repair: most offspring are left untouched, which
+    # is when a parent could be counted twice
+    config = GAConfig(
+        pop_size=8,
+        generations=3,
+        crossover_prob=0.0,
+        mutation_prob=0.5,
+        repair_config={"enabled": False},
+    )
+    scheduler = GAScheduler(config, context, hard, soft)
+    scheduler.setup_toolbox()
+    with redirect_stdout(io.StringIO()):
+        scheduler.initialize_population()
+        scheduler.evolve()
+
+    population = scheduler.population
+    assert len({id(ind) for ind in population}) == len(population)
+    assert len({_genome(ind) for ind in population}) == len(population)